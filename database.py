@@ -5,10 +5,173 @@ Substitui o IndexedDB do React por SQLite
 """
 
 import sqlite3
+import csv
 import json
 import os
+import atexit
+import contextlib
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any, Union
+
+logger = logging.getLogger(__name__)
+
+# SQL das operações frequentes, definido uma única vez para que o texto
+# seja idêntico em todas as chamadas e reaproveite o cache de statements
+_SQL_INSERT = '''
+    INSERT INTO inspecoes (
+        plataforma, modulo, setor, tipo_equipamento, tag, defeito, causa,
+        categoria_rti, recomendacao, ultima_inspecao, data_inspecao,
+        tipo_dano, observacoes, foto_path, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_UPDATE = '''
+    UPDATE inspecoes SET
+        plataforma = ?, modulo = ?, setor = ?, tipo_equipamento = ?,
+        tag = ?, defeito = ?, causa = ?, categoria_rti = ?,
+        recomendacao = ?, ultima_inspecao = ?, data_inspecao = ?,
+        tipo_dano = ?, observacoes = ?, foto_path = ?, updated_at = ?
+    WHERE id = ?
+'''
+
+_SQL_SELECT_ALL = '''
+    SELECT * FROM inspecoes
+    ORDER BY data_inspecao DESC, created_at DESC, id DESC
+'''
+
+# Número máximo de consultas mantidas no cache de leitura
+_CACHE_MAX = 128
+
+# Linhas por executemany na importação de CSV
+_IMPORT_BATCH_SIZE = 10000
+
+# Números de linha inválidas listados no erro de importação
+_IMPORT_BAD_LINES_SHOWN = 10
+
+# Linhas lidas por vez do cursor ao percorrer todas as inspeções
+_FETCH_BATCH_SIZE = 500
+
+# LIMIT -1 = sem limite no SQLite
+_SQL_SELECT_PAGE = _SQL_SELECT_ALL + 'LIMIT ? OFFSET ?'
+
+# Colunas exibidas na lista de inspeções, na ordem do Treeview (+ última inspeção para o status)
+_SQL_SELECT_LIST_PAGE = '''
+    SELECT id, tag, tipo_equipamento, plataforma, data_inspecao, ultima_inspecao
+    FROM inspecoes
+    ORDER BY data_inspecao DESC, created_at DESC, id DESC
+    LIMIT ? OFFSET ?
+'''
+
+_SQL_SELECT_BY_ID = 'SELECT * FROM inspecoes WHERE id = ?'
+
+_SQL_COUNT = 'SELECT COUNT(*) AS total FROM inspecoes'
+
+_SQL_DELETE_BY_ID = 'DELETE FROM inspecoes WHERE id = ?'
+
+_SQL_SELECT_BY_DATE_RANGE = '''
+    SELECT * FROM inspecoes
+    WHERE data_inspecao BETWEEN ? AND ?
+    ORDER BY data_inspecao DESC
+'''
+
+_SQL_SELECT_BY_EQUIPMENT = '''
+    SELECT * FROM inspecoes
+    WHERE tipo_equipamento = ?
+    ORDER BY data_inspecao DESC
+'''
+
+_SQL_INSERT_HISTORY = '''
+    INSERT INTO historico_alteracoes
+    (inspecao_id, campo, valor_anterior, valor_novo)
+    VALUES (?, ?, ?, ?)
+'''
+
+# Colunas registradas no histórico -> chave correspondente no dicionário do formulário
+_TRACKED_FIELDS = {
+    'plataforma': 'plataforma',
+    'modulo': 'modulo',
+    'setor': 'setor',
+    'tipo_equipamento': 'tipoEquipamento',
+    'tag': 'tag',
+    'defeito': 'defeito',
+    'causa': 'causa',
+    'categoria_rti': 'categoriaRTI',
+    'recomendacao': 'recomendacao',
+    'ultima_inspecao': 'ultima',
+    'data_inspecao': 'data',
+    'tipo_dano': 'tipoDano',
+    'observacoes': 'observacoes',
+    'foto_path': 'foto_path',
+}
+
+_RAISE = object()
+
+def _db_method(error_message: str, fallback: Any = _RAISE):
+    """
+    Centraliza o tratamento de erro dos métodos do banco
+    
+    Em caso de exceção desfaz a transação pendente, registra o erro e
+    relança a exceção ou devolve o valor de fallback.
+    
+    Args:
+        error_message: Mensagem de erro (formatada com os argumentos posicionais)
+        fallback: Valor retornado em caso de erro (chamado se for callable);
+                  se omitido, a exceção é relançada
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except Exception:
+                if self.conn is not None and self.conn.in_transaction:
+                    self.conn.rollback()
+                logger.error("❌ %s", error_message.format(*args, *kwargs.values()), exc_info=True)
+                if fallback is _RAISE:
+                    raise
+                return fallback() if callable(fallback) else fallback
+        return wrapper
+    return decorator
+
+def _dict_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    """Converte cada linha diretamente em dict (evita o dict(row) por linha)"""
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+def _remove_photo(path: str):
+    """Remove o arquivo da foto; ausência do arquivo não é erro"""
+    try:
+        os.unlink(path)
+        logger.debug("✅ Foto removida: %s", path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("⚠️ Erro ao remover foto: %s", e)
+
+def _copy_result(value: Any) -> Any:
+    """Cópia rasa do resultado em cache (dict por linha), para o chamador poder alterá-la"""
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return [dict(row) for row in value]
+    return value
+
+def _remove_photos(paths: List[str]):
+    """Remove várias fotos (unlink direto: um syscall por arquivo)"""
+    for path in paths:
+        _remove_photo(path)
+
+@functools.lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
+def _now_iso_cached() -> str:
+    """Timestamp ISO atual com resolução de segundos (recalculado no máximo uma vez por segundo)"""
+    return _iso_for_second(int(time.time()))
 
 class InspectionDatabase:
     """Classe para gerenciar o banco de dados de inspeções"""
@@ -17,332 +180,500 @@ class InspectionDatabase:
         """Inicializa o banco de dados"""
         self.db_path = db_path
         self.conn = None
+        # Cache LRU das consultas de leitura, limpo a cada escrita
+        self._cache = OrderedDict()
         self.connect()
         self.create_tables()
     
     def connect(self):
         """Conecta ao banco de dados"""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            # Permite compartilhar a conexão entre threads (acesso serializado por _DB_LOCK).
+            # isolation_level=None: as transações são abertas explicitamente em
+            # transaction(), sem o BEGIN implícito que o módulo sqlite3 insere
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                        cached_statements=256, isolation_level=None)
             # Habilitar foreign keys
             self.conn.execute("PRAGMA foreign_keys = ON")
             # Configurar para retornar dicionários
-            self.conn.row_factory = sqlite3.Row
-            print(f"✅ Conectado ao banco: {self.db_path}")
-        except Exception as e:
-            print(f"❌ Erro ao conectar ao banco: {e}")
+            self.conn.row_factory = _dict_factory
+            # WAL reduz fsyncs por commit e não bloqueia leitores durante escritas
+            journal_mode = self.conn.execute("PRAGMA journal_mode = WAL").fetchone()['journal_mode']
+            if str(journal_mode).lower() != 'wal':
+                # Alguns sistemas de arquivos (ex.: rede) não suportam WAL
+                logger.warning("⚠️ Modo WAL indisponível, usando journal_mode=%s", journal_mode)
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            self.conn.execute("PRAGMA temp_store = MEMORY")
+            self.conn.execute("PRAGMA cache_size = -20000")  # ~20MB
+            self.conn.execute("PRAGMA mmap_size = 268435456")  # 256MB
+            self.conn.execute("PRAGMA busy_timeout = 30000")
+            # Lotes grandes ficam no cache até o commit, sem gravações parciais no meio da transação
+            self.conn.execute("PRAGMA cache_spill = OFF")
+            logger.debug("✅ Conectado ao banco: %s", self.db_path)
+        except Exception:
+            logger.error("❌ Erro ao conectar ao banco", exc_info=True)
             raise
     
+    @_db_method("Erro ao criar tabelas")
     def create_tables(self):
         """Cria as tabelas necessárias"""
-        try:
-            cursor = self.conn.cursor()
-            
-            # Tabela principal de inspeções
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS inspecoes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    plataforma TEXT NOT NULL,
-                    modulo TEXT NOT NULL,
-                    setor TEXT NOT NULL,
-                    tipo_equipamento TEXT NOT NULL,
-                    tag TEXT NOT NULL,
-                    defeito TEXT NOT NULL,
-                    causa TEXT NOT NULL,
-                    categoria_rti TEXT NOT NULL,
-                    recomendacao TEXT NOT NULL,
-                    ultima_inspecao DATE NOT NULL,
-                    data_inspecao DATE NOT NULL,
-                    tipo_dano TEXT NOT NULL,
-                    observacoes TEXT,
-                    foto_path TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Tabela para histórico de alterações
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS historico_alteracoes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    inspecao_id INTEGER NOT NULL,
-                    campo TEXT NOT NULL,
-                    valor_anterior TEXT,
-                    valor_novo TEXT,
-                    data_alteracao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (inspecao_id) REFERENCES inspecoes (id)
-                )
-            ''')
-            
-            # Índices para melhor performance
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_inspecoes_tag ON inspecoes(tag)
-            ''')
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_inspecoes_data ON inspecoes(data_inspecao)
-            ''')
+        cursor = self.conn.cursor()
+        # Muda a cada CREATE/DROP/ALTER: indica se algo foi criado ou migrado agora
+        schema_version = cursor.execute("PRAGMA schema_version").fetchone()['schema_version']
+        
+        # Tabela principal de inspeções
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS inspecoes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                plataforma TEXT NOT NULL,
+                modulo TEXT NOT NULL,
+                setor TEXT NOT NULL,
+                tipo_equipamento TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                defeito TEXT NOT NULL,
+                causa TEXT NOT NULL,
+                categoria_rti TEXT NOT NULL,
+                recomendacao TEXT NOT NULL,
+                ultima_inspecao DATE NOT NULL,
+                data_inspecao DATE NOT NULL,
+                tipo_dano TEXT NOT NULL,
+                observacoes TEXT,
+                foto_path TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Bancos antigos criaram o histórico sem ON DELETE CASCADE; como o
+        # SQLite não altera foreign keys, a tabela é recriada e os dados copiados
+        history_fks = cursor.execute("PRAGMA foreign_key_list(historico_alteracoes)").fetchall()
+        migrate_history = any(fk['on_delete'] != 'CASCADE' for fk in history_fks)
+        if migrate_history:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("ALTER TABLE historico_alteracoes RENAME TO historico_alteracoes_antigo")
+        
+        # Tabela para histórico de alterações
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS historico_alteracoes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                inspecao_id INTEGER NOT NULL,
+                campo TEXT NOT NULL,
+                valor_anterior TEXT,
+                valor_novo TEXT,
+                data_alteracao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (inspecao_id) REFERENCES inspecoes (id) ON DELETE CASCADE
+            )
+        ''')
+        
+        if migrate_history:
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_inspecoes_plataforma ON inspecoes(plataforma)
+                INSERT INTO historico_alteracoes
+                SELECT * FROM historico_alteracoes_antigo
+                WHERE inspecao_id IN (SELECT id FROM inspecoes)
             ''')
-            
+            cursor.execute("DROP TABLE historico_alteracoes_antigo")
+            logger.debug("✅ Histórico migrado para ON DELETE CASCADE")
+        
+        # Índices para melhor performance
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_inspecoes_tag ON inspecoes(tag)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_inspecoes_data ON inspecoes(data_inspecao)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_inspecoes_plataforma ON inspecoes(plataforma)
+        ''')
+        # Usado pelo ON DELETE CASCADE para localizar o histórico da inspeção
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_historico_inspecao ON historico_alteracoes(inspecao_id)
+        ''')
+        # Índice na mesma ordem do ORDER BY de get_all_inspections que também
+        # cobre as colunas da listagem: get_inspection_list não lê a tabela.
+        # created_at tem resolução de segundo, então id DESC desempata as
+        # inspeções salvas no mesmo segundo (mais recente primeiro). Substitui
+        # idx_inspecoes_data_created e idx_inspecoes_lista (sem o id)
+        cursor.execute("DROP INDEX IF EXISTS idx_inspecoes_data_created")
+        cursor.execute("DROP INDEX IF EXISTS idx_inspecoes_lista")
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_inspecoes_listagem
+            ON inspecoes(data_inspecao DESC, created_at DESC, id DESC,
+                         tag, tipo_equipamento, plataforma, ultima_inspecao)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_inspecoes_tipo_equipamento
+            ON inspecoes(tipo_equipamento, data_inspecao DESC)
+        ''')
+        
+        # Atualizar estatísticas para o planner escolher os índices só quando
+        # o esquema mudou (índice novo ou migração): ANALYZE percorre a tabela
+        # e os índices inteiros, caro demais para toda abertura de conexão
+        if cursor.execute("PRAGMA schema_version").fetchone()['schema_version'] != schema_version:
+            cursor.execute('ANALYZE')
+        
+        self.conn.commit()
+        logger.debug("✅ Tabelas criadas com sucesso")
+    
+    def _inspection_row(self, data: Dict[str, Any], now: str) -> tuple:
+        """Monta a tupla de valores para inserção na ordem das colunas"""
+        return (
+            data.get('plataforma', ''),
+            data.get('modulo', ''),
+            data.get('setor', ''),
+            data.get('tipoEquipamento', ''),
+            data.get('tag', ''),
+            data.get('defeito', ''),
+            data.get('causa', ''),
+            data.get('categoriaRTI', ''),
+            data.get('recomendacao', ''),
+            data.get('ultima', ''),
+            data.get('data', ''),
+            data.get('tipoDano', ''),
+            data.get('observacoes', ''),
+            data.get('foto_path', ''),
+            now,
+            now
+        )
+    
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Agrupa várias escritas em uma única transação
+        
+        Faz commit ao sair do bloco e rollback em caso de exceção. Chamadas
+        aninhadas participam da transação mais externa.
+        
+        Yields:
+            sqlite3.Cursor: Cursor para as operações da transação
+        """
+        cursor = self.conn.cursor()
+        try:
+            if self.conn.in_transaction:
+                yield cursor
+                return
+            
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                self.conn.rollback()
+                raise
             self.conn.commit()
-            print("✅ Tabelas criadas com sucesso")
-            
-        except Exception as e:
-            print(f"❌ Erro ao criar tabelas: {e}")
-            raise
+        finally:
+            self._cache.clear()
+    
+    def _insert_inspections(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insere as inspeções em uma única transação e retorna os IDs gerados"""
+        # Um único timestamp para todo o lote
+        now = _now_iso_cached()
+        inspections_data = [self._inspection_row(data, now) for data in rows]
+        
+        # Uma única transação: um commit (e um fsync) para todo o lote
+        with self.transaction() as cursor:
+            cursor.executemany(_SQL_INSERT, inspections_data)
+            
+            # IDs são contíguos dentro da transação (AUTOINCREMENT + lock de escrita)
+            last_id = cursor.execute("SELECT last_insert_rowid() AS last_id").fetchone()['last_id']
+        
+        first_id = last_id - len(inspections_data) + 1
+        return list(range(first_id, last_id + 1))
     
+    @_db_method("Erro ao salvar inspeção")
     def save_inspection(self, data: Dict[str, Any]) -> int:
         """Salva uma nova inspeção"""
-        try:
-            cursor = self.conn.cursor()
-            
-            # Preparar dados para inserção
-            inspection_data = (
-                data.get('plataforma', ''),
-                data.get('modulo', ''),
-                data.get('setor', ''),
-                data.get('tipoEquipamento', ''),
-                data.get('tag', ''),
-                data.get('defeito', ''),
-                data.get('causa', ''),
-                data.get('categoriaRTI', ''),
-                data.get('recomendacao', ''),
-                data.get('ultima', ''),
-                data.get('data', ''),
-                data.get('tipoDano', ''),
-                data.get('observacoes', ''),
-                data.get('foto_path', ''),
-                datetime.now().isoformat(),
-                datetime.now().isoformat()
-            )
-            
-            cursor.execute('''
-                INSERT INTO inspecoes (
-                    plataforma, modulo, setor, tipo_equipamento, tag, defeito, causa,
-                    categoria_rti, recomendacao, ultima_inspecao, data_inspecao,
-                    tipo_dano, observacoes, foto_path, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', inspection_data)
-            
-            inspection_id = cursor.lastrowid
-            self.conn.commit()
-            
-            print(f"✅ Inspeção salva com ID: {inspection_id}")
-            return inspection_id
-            
-        except Exception as e:
-            print(f"❌ Erro ao salvar inspeção: {e}")
-            self.conn.rollback()
-            raise
+        inspection_id = self._insert_inspections([data])[0]
+        
+        logger.debug("✅ Inspeção salva com ID: %s", inspection_id)
+        return inspection_id
     
-    def get_all_inspections(self) -> List[Dict[str, Any]]:
-        """Retorna todas as inspeções"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT * FROM inspecoes 
-                ORDER BY data_inspecao DESC, created_at DESC
-            ''')
-            
-            inspections = []
-            for row in cursor.fetchall():
-                inspection = dict(row)
-                inspections.append(inspection)
-            
-            print(f"✅ {len(inspections)} inspeções encontradas")
-            return inspections
-            
-        except Exception as e:
-            print(f"❌ Erro ao buscar inspeções: {e}")
+    @_db_method("Erro ao salvar inspeções em lote")
+    def save_inspections_bulk(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Salva várias inspeções em uma única transação
+        
+        Args:
+            rows: Lista de dados de inspeção (mesmo formato de save_inspection)
+            
+        Returns:
+            List[int]: IDs das inspeções inseridas, na ordem recebida
+        """
+        if not rows:
             return []
+        
+        inspection_ids = self._insert_inspections(rows)
+        
+        logger.debug("✅ %s inspeções salvas (IDs %s-%s)", len(inspection_ids), inspection_ids[0], inspection_ids[-1])
+        return inspection_ids
+    
+    @_db_method("Erro ao importar CSV {0}")
+    def import_inspections_csv(self, csv_path: str, batch_size: int = _IMPORT_BATCH_SIZE) -> int:
+        """
+        Importa inspeções de um arquivo CSV
+        
+        O cabeçalho usa as mesmas chaves do formulário (plataforma, tipoEquipamento,
+        ultima, data...); colunas ausentes do cabeçalho ficam vazias. A importação é atômica: qualquer erro desfaz o arquivo
+        inteiro, sem deixar uma importação parcial.
+        
+        Args:
+            csv_path: Caminho do arquivo CSV
+            batch_size: Linhas enviadas por executemany
+            
+        Returns:
+            int: Número de inspeções importadas
+            
+        Raises:
+            ValueError: Se alguma linha tiver número de colunas diferente do cabeçalho
+        """
+        total = 0
+        bad_lines = []
+        with open(csv_path, newline='', encoding='utf-8-sig') as csv_file, self.transaction():
+            reader = csv.reader(csv_file)
+            header = next(reader, [])
+            batch = []
+            for row in reader:
+                # Linhas em branco (comuns no fim de CSVs exportados) são ignoradas
+                if not row:
+                    continue
+                if len(row) != len(header):
+                    bad_lines.append(reader.line_num)
+                    continue
+                # Depois da primeira linha inválida só continua a varredura
+                # para listar todas; nada será gravado
+                if bad_lines:
+                    continue
+                batch.append(dict(zip(header, row)))
+                if len(batch) >= batch_size:
+                    self._insert_inspections(batch)
+                    total += len(batch)
+                    batch = []
+            
+            if bad_lines:
+                shown = ', '.join(map(str, bad_lines[:_IMPORT_BAD_LINES_SHOWN]))
+                if len(bad_lines) > _IMPORT_BAD_LINES_SHOWN:
+                    shown += ', ...'
+                raise ValueError(f"{len(bad_lines)} linha(s) com número de colunas diferente "
+                                 f"do cabeçalho ({len(header)}): {shown}")
+            
+            if batch:
+                self._insert_inspections(batch)
+                total += len(batch)
+        
+        logger.debug("✅ %s inspeções importadas de %s", total, csv_path)
+        return total
     
+    @_db_method("Erro ao buscar inspeções", fallback=list)
+    def get_all_inspections(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Retorna as inspeções, opcionalmente paginadas
+        
+        Args:
+            limit: Número máximo de inspeções (None = todas)
+            offset: Quantidade de inspeções a pular
+            
+        Returns:
+            List[Dict[str, Any]]: Inspeções ordenadas da mais recente para a mais antiga
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(_SQL_SELECT_PAGE, (-1 if limit is None else limit, offset))
+        
+        inspections = cursor.fetchall()
+        
+        logger.debug("✅ %s inspeções encontradas", len(inspections))
+        return inspections
+    
+    @_db_method("Erro ao buscar lista de inspeções", fallback=list)
+    def get_inspection_list(self, limit: Optional[int] = None, offset: int = 0) -> List[tuple]:
+        """
+        Retorna apenas as colunas da listagem, como tuplas
+        
+        Args:
+            limit: Número máximo de inspeções (None = todas)
+            offset: Quantidade de inspeções a pular
+            
+        Returns:
+            List[tuple]: (id, tag, tipo_equipamento, plataforma, data_inspecao, ultima_inspecao)
+        """
+        cursor = self.conn.cursor()
+        # Tuplas direto do sqlite3, sem montar dicionários
+        cursor.row_factory = None
+        cursor.execute(_SQL_SELECT_LIST_PAGE, (-1 if limit is None else limit, offset))
+        return cursor.fetchall()
+    
+    @_db_method("Erro ao contar inspeções", fallback=0)
+    def count_inspections(self) -> int:
+        """Retorna o número total de inspeções"""
+        return self.conn.execute(_SQL_COUNT).fetchone()['total']
+    
+    def iter_all_inspections(self, batch_size: int = _FETCH_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre todas as inspeções sem carregar a tabela inteira em memória
+        
+        Args:
+            batch_size: Linhas lidas do cursor por vez
+            
+        Returns:
+            Iterator[Dict[str, Any]]: Inspeções na mesma ordem de get_all_inspections
+        """
+        # Cursor próprio: outras consultas na conexão não interrompem a iteração
+        cursor = self.conn.cursor()
+        cursor.execute(_SQL_SELECT_ALL)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+    
+    def clear_cache(self):
+        """Descarta o cache de leitura (ex.: após escritas feitas por outra conexão)"""
+        self._cache.clear()
+    
+    def _cached(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        """
+        Retorna o resultado em cache para a chave ou executa a consulta
+        
+        Args:
+            key: Identificação da consulta (método, parâmetros)
+            loader: Função que executa a consulta no banco
+            
+        Returns:
+            Any: Cópia do resultado (linha ou lista de linhas); alterá-la não afeta o cache
+        """
+        try:
+            value = self._cache[key]
+            self._cache.move_to_end(key)
+            return _copy_result(value)
+        except KeyError:
+            pass
+        
+        # Erros do loader propagam sem que nada seja armazenado
+        value = loader()
+        self._cache[key] = value
+        if len(self._cache) > _CACHE_MAX:
+            self._cache.popitem(last=False)
+        return _copy_result(value)
+    
+    @_db_method("Erro ao buscar inspeção {0}", fallback=None)
     def get_inspection_by_id(self, inspection_id: int) -> Optional[Dict[str, Any]]:
         """Retorna uma inspeção específica por ID"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT * FROM inspecoes WHERE id = ?', (inspection_id,))
-            
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
-            
-        except Exception as e:
-            print(f"❌ Erro ao buscar inspeção {inspection_id}: {e}")
-            return None
+        return self._cached(
+            ('get_inspection_by_id', inspection_id),
+            lambda: self.conn.execute(_SQL_SELECT_BY_ID, (inspection_id,)).fetchone())
     
+    @_db_method("Erro ao atualizar inspeção {0}", fallback=False)
     def update_inspection(self, inspection_id: int, data: Dict[str, Any]) -> bool:
         """Atualiza uma inspeção existente"""
-        try:
-            cursor = self.conn.cursor()
-            
-            # Buscar dados atuais para histórico
-            current_data = self.get_inspection_by_id(inspection_id)
-            if not current_data:
+        # Preparar dados para atualização
+        update_data = (
+            data.get('plataforma', ''),
+            data.get('modulo', ''),
+            data.get('setor', ''),
+            data.get('tipoEquipamento', ''),
+            data.get('tag', ''),
+            data.get('defeito', ''),
+            data.get('causa', ''),
+            data.get('categoriaRTI', ''),
+            data.get('recomendacao', ''),
+            data.get('ultima', ''),
+            data.get('data', ''),
+            data.get('tipoDano', ''),
+            data.get('observacoes', ''),
+            data.get('foto_path', ''),
+            _now_iso_cached(),
+            inspection_id
+        )
+        
+        # Buscar dados atuais para histórico dentro da mesma transação de
+        # escrita (o RETURNING do SQLite só expõe os valores já atualizados,
+        # então o estado anterior precisa ser lido antes do UPDATE)
+        with self.transaction() as cursor:
+            current_data = cursor.execute(_SQL_SELECT_BY_ID, (inspection_id,)).fetchone()
+            if current_data is None:
                 return False
             
-            # Preparar dados para atualização
-            update_data = (
-                data.get('plataforma', ''),
-                data.get('modulo', ''),
-                data.get('setor', ''),
-                data.get('tipoEquipamento', ''),
-                data.get('tag', ''),
-                data.get('defeito', ''),
-                data.get('causa', ''),
-                data.get('categoriaRTI', ''),
-                data.get('recomendacao', ''),
-                data.get('ultima', ''),
-                data.get('data', ''),
-                data.get('tipoDano', ''),
-                data.get('observacoes', ''),
-                data.get('foto_path', ''),
-                datetime.now().isoformat(),
-                inspection_id
-            )
-            
-            cursor.execute('''
-                UPDATE inspecoes SET
-                    plataforma = ?, modulo = ?, setor = ?, tipo_equipamento = ?,
-                    tag = ?, defeito = ?, causa = ?, categoria_rti = ?,
-                    recomendacao = ?, ultima_inspecao = ?, data_inspecao = ?,
-                    tipo_dano = ?, observacoes = ?, foto_path = ?, updated_at = ?
-                WHERE id = ?
-            ''', update_data)
+            cursor.execute(_SQL_UPDATE, update_data)
             
             # Registrar alterações no histórico
             self._log_changes(inspection_id, current_data, data)
-            
-            self.conn.commit()
-            print(f"✅ Inspeção {inspection_id} atualizada com sucesso")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Erro ao atualizar inspeção {inspection_id}: {e}")
-            self.conn.rollback()
-            return False
+        
+        logger.debug("✅ Inspeção %s atualizada com sucesso", inspection_id)
+        return True
     
+    @_db_method("Erro ao deletar inspeção {0}", fallback=False)
     def delete_inspection(self, inspection_id: int) -> bool:
         """Deleta uma inspeção"""
-        try:
-            cursor = self.conn.cursor()
-            
-            # Buscar caminho da foto para deletar arquivo
-            inspection = self.get_inspection_by_id(inspection_id)
-            if inspection and inspection.get('foto_path'):
-                try:
-                    if os.path.exists(inspection['foto_path']):
-                        os.remove(inspection['foto_path'])
-                        print(f"✅ Foto removida: {inspection['foto_path']}")
-                except Exception as e:
-                    print(f"⚠️ Erro ao remover foto: {e}")
-            
-            cursor.execute('DELETE FROM inspecoes WHERE id = ?', (inspection_id,))
-            self.conn.commit()
-            
-            print(f"✅ Inspeção {inspection_id} deletada com sucesso")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Erro ao deletar inspeção {inspection_id}: {e}")
-            self.conn.rollback()
-            return False
+        # Buscar caminho da foto antes de remover o registro
+        inspection = self.get_inspection_by_id(inspection_id)
+        
+        with self.transaction() as cursor:
+            cursor.execute(_SQL_DELETE_BY_ID, (inspection_id,))
+        
+        # Arquivo removido só após o commit, fora do caminho crítico: se o
+        # DELETE falhar a foto continua existindo junto com o registro. Thread
+        # não-daemon: o interpretador espera a remoção antes de encerrar
+        if inspection and inspection.get('foto_path'):
+            threading.Thread(target=_remove_photo, args=(inspection['foto_path'],)).start()
+        
+        logger.debug("✅ Inspeção %s deletada com sucesso", inspection_id)
+        return True
     
+    @_db_method("Erro ao limpar inspeções", fallback=False)
     def clear_all_inspections(self) -> bool:
         """Remove todas as inspeções"""
-        try:
-            cursor = self.conn.cursor()
-            
-            # Remover todas as fotos
-            cursor.execute('SELECT foto_path FROM inspecoes WHERE foto_path IS NOT NULL')
-            for row in cursor.fetchall():
-                foto_path = row['foto_path']
-                if foto_path and os.path.exists(foto_path):
-                    try:
-                        os.remove(foto_path)
-                    except Exception as e:
-                        print(f"⚠️ Erro ao remover foto: {e}")
-            
+        # Caminhos lidos na mesma transação do DELETE; o histórico é
+        # removido em cascata pela foreign key
+        with self.transaction() as cursor:
+            cursor.execute("SELECT foto_path FROM inspecoes WHERE foto_path IS NOT NULL AND foto_path != ''")
+            photo_paths = [row['foto_path'] for row in cursor.fetchall()]
             cursor.execute('DELETE FROM inspecoes')
-            cursor.execute('DELETE FROM historico_alteracoes')
-            self.conn.commit()
-            
-            print("✅ Todas as inspeções foram removidas")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Erro ao limpar inspeções: {e}")
-            self.conn.rollback()
-            return False
+        
+        # Fotos removidas só após o commit, como em delete_inspection: se o
+        # DELETE falhar os registros continuam apontando para arquivos existentes.
+        # Ação rara e explícita: remoção síncrona, concluída antes de retornar
+        _remove_photos(photo_paths)
+        
+        logger.debug("✅ Todas as inspeções foram removidas")
+        return True
     
     def _log_changes(self, inspection_id: int, old_data: Dict, new_data: Dict):
         """Registra alterações no histórico"""
         try:
-            cursor = self.conn.cursor()
-            
-            for field in old_data.keys():
-                if field in ['id', 'created_at', 'updated_at']:
-                    continue
-                    
-                old_value = str(old_data.get(field, ''))
-                new_value = str(new_data.get(field, ''))
+            changes = []
+            for column, form_key in _TRACKED_FIELDS.items():
+                old_value = str(old_data.get(column, ''))
+                new_value = str(new_data.get(form_key, ''))
                 
                 if old_value != new_value:
-                    cursor.execute('''
-                        INSERT INTO historico_alteracoes 
-                        (inspecao_id, campo, valor_anterior, valor_novo)
-                        VALUES (?, ?, ?, ?)
-                    ''', (inspection_id, field, old_value, new_value))
+                    changes.append((inspection_id, column, old_value, new_value))
+            
+            # Salvamento idempotente: nada a registrar
+            if not changes:
+                return
+            
+            # Inserção única na mesma transação do UPDATE (commit feito pelo chamador)
+            self.conn.executemany(_SQL_INSERT_HISTORY, changes)
             
         except Exception as e:
-            print(f"⚠️ Erro ao registrar histórico: {e}")
+            logger.warning("⚠️ Erro ao registrar histórico: %s", e)
     
+    @_db_method("Erro ao buscar inspeções por período", fallback=list)
     def get_inspections_by_date_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Busca inspeções por período"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT * FROM inspecoes 
-                WHERE data_inspecao BETWEEN ? AND ?
-                ORDER BY data_inspecao DESC
-            ''', (start_date, end_date))
-            
-            inspections = []
-            for row in cursor.fetchall():
-                inspections.append(dict(row))
-            
-            return inspections
-            
-        except Exception as e:
-            print(f"❌ Erro ao buscar inspeções por período: {e}")
-            return []
+        return self._cached(
+            ('get_inspections_by_date_range', start_date, end_date),
+            lambda: self.conn.execute(_SQL_SELECT_BY_DATE_RANGE, (start_date, end_date)).fetchall())
     
+    @_db_method("Erro ao buscar inspeções por equipamento", fallback=list)
     def get_inspections_by_equipment(self, equipment_type: str) -> List[Dict[str, Any]]:
         """Busca inspeções por tipo de equipamento"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT * FROM inspecoes 
-                WHERE tipo_equipamento = ?
-                ORDER BY data_inspecao DESC
-            ''', (equipment_type,))
-            
-            inspections = []
-            for row in cursor.fetchall():
-                inspections.append(dict(row))
-            
-            return inspections
-            
-        except Exception as e:
-            print(f"❌ Erro ao buscar inspeções por equipamento: {e}")
-            return []
+        return self._cached(
+            ('get_inspections_by_equipment', equipment_type),
+            lambda: self.conn.execute(_SQL_SELECT_BY_EQUIPMENT, (equipment_type,)).fetchall())
     
     def close(self):
         """Fecha a conexão com o banco"""
         if self.conn:
             self.conn.close()
-            print("✅ Conexão com banco fechada")
+            logger.debug("✅ Conexão com banco fechada")
     
     def __enter__(self):
         """Context manager entry"""
@@ -352,18 +683,42 @@ class InspectionDatabase:
         """Context manager exit"""
         self.close()
 
+# Instância única reaproveitada pelas funções de conveniência, mantendo
+# o cache de páginas e de statements do SQLite entre chamadas
+_DB_SINGLETON: Optional[InspectionDatabase] = None
+_DB_LOCK = threading.RLock()
+
+def _get_db() -> InspectionDatabase:
+    """Retorna a conexão compartilhada, criando-a na primeira chamada"""
+    global _DB_SINGLETON
+    with _DB_LOCK:
+        if _DB_SINGLETON is None:
+            _DB_SINGLETON = InspectionDatabase()
+            atexit.register(_close_db)
+        return _DB_SINGLETON
+
+def _close_db():
+    """Fecha a conexão compartilhada ao encerrar o processo"""
+    global _DB_SINGLETON
+    with _DB_LOCK:
+        if _DB_SINGLETON is not None:
+            _DB_SINGLETON.close()
+            _DB_SINGLETON = None
+
 # Funções de conveniência para compatibilidade com o React
-def save_data_to_database(data: Dict[str, Any]) -> int:
+def save_data_to_database(data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Union[int, List[int]]:
     """Salva dados no banco (equivalente ao saveDataToIndexedDB do React)"""
-    with InspectionDatabase() as db:
-        return db.save_inspection(data)
+    with _DB_LOCK:
+        if isinstance(data, list):
+            return _get_db().save_inspections_bulk(data)
+        return _get_db().save_inspection(data)
 
 def get_all_inspections() -> List[Dict[str, Any]]:
     """Retorna todas as inspeções (equivalente ao getAllInspecoes do React)"""
-    with InspectionDatabase() as db:
-        return db.get_all_inspections()
+    with _DB_LOCK:
+        return _get_db().get_all_inspections()
 
 def clear_all_inspections() -> bool:
     """Remove todas as inspeções (equivalente ao clearInspecoes do React)"""
-    with InspectionDatabase() as db:
-        return db.clear_all_inspections()
+    with _DB_LOCK:
+        return _get_db().clear_all_inspections()
@@ -4,9 +4,67 @@ Sistema de validação de datas para inspeções
 Baseado no projeto React original
 """
 
-from datetime import datetime, timedelta
-from typing import Tuple, Optional
+from datetime import date, datetime, timedelta
+from typing import Iterator, List, Tuple, Optional
 import calendar
+import functools
+import time
+
+# Validade do "hoje" em cache (segundos)
+_TODAY_TTL = 1.0
+_today_cache: Tuple[float, Optional[date]] = (0.0, None)
+
+# Dias úteis (Segunda a Sexta) em um trecho de N dias (0-6) que começa
+# no dia da semana W: _EXTRA_WORKING_DAYS[W][N]
+_EXTRA_WORKING_DAYS = tuple(
+    tuple(sum(1 for i in range(n) if (weekday + i) % 7 < 5) for n in range(7))
+    for weekday in range(7)
+)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(date_str: str) -> date:
+    """
+    Converte uma data 'YYYY-MM-DD' em date (resultado memoizado)
+    
+    Args:
+        date_str: Data no formato 'YYYY-MM-DD'
+        
+    Returns:
+        date: Data convertida (ValueError se inválida)
+    """
+    if (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+        return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    # Formatos não canônicos (ex.: '2024-1-5') seguem as regras do strptime
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+def _add_months(base_date: date, months: int) -> date:
+    """
+    Soma meses de calendário a uma data
+    
+    Args:
+        base_date: Data inicial
+        months: Número de meses a somar
+        
+    Returns:
+        date: Nova data (dia ajustado ao último dia do mês quando necessário,
+              ex.: 31/01 + 1 mês = 28/02 ou 29/02)
+    """
+    month_index = base_date.month - 1 + months
+    year = base_date.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(base_date.day, calendar.monthrange(year, month)[1])
+    return date(year, month, day)
+
+def _today() -> date:
+    """Retorna a data atual, recalculada no máximo uma vez por _TODAY_TTL"""
+    global _today_cache
+    checked_at, today = _today_cache
+    now = time.monotonic()
+    if today is None or now - checked_at >= _TODAY_TTL:
+        today = datetime.now().date()
+        _today_cache = (now, today)
+    return today
 
 class DateValidator:
     """Classe para validação e manipulação de datas"""
@@ -26,13 +84,13 @@ class DateValidator:
             if not date_str:
                 return False, "Data de inspeção é obrigatória"
             
-            inspection_date = datetime.strptime(date_str, '%Y-%m-%d')
-            today = datetime.now().date()
+            inspection_date = _parse_iso(date_str)
+            today = _today()
             
-            if inspection_date.date() > today:
+            if inspection_date > today:
                 return False, "Data de inspeção não pode ser no futuro"
             
-            if inspection_date.date() < today - timedelta(days=30):
+            if inspection_date < today - timedelta(days=30):
                 return False, "Data de inspeção não pode ser há mais de 30 dias"
             
             return True, "Data válida"
@@ -55,13 +113,13 @@ class DateValidator:
             if not date_str:
                 return False, "Data da última inspeção é obrigatória"
             
-            last_date = datetime.strptime(date_str, '%Y-%m-%d')
-            today = datetime.now().date()
+            last_date = _parse_iso(date_str)
+            today = _today()
             
-            if last_date.date() > today:
+            if last_date > today:
                 return False, "Data da última inspeção não pode ser no futuro"
             
-            if last_date.date() < today - timedelta(days=3650):  # 10 anos
+            if last_date < today - timedelta(days=3650):  # 10 anos
                 return False, "Data da última inspeção não pode ser há mais de 10 anos"
             
             return True, "Data válida"
@@ -82,8 +140,8 @@ class DateValidator:
             str: Data da próxima inspeção (YYYY-MM-DD)
         """
         try:
-            last_date = datetime.strptime(last_inspection_date, '%Y-%m-%d')
-            next_date = last_date + timedelta(days=validity_months * 30)
+            last_date = _parse_iso(last_inspection_date)
+            next_date = _add_months(last_date, validity_months)
             return next_date.strftime('%Y-%m-%d')
         except ValueError:
             return ""
@@ -104,11 +162,11 @@ class DateValidator:
             if not last_inspection_date:
                 return False
             
-            last_date = datetime.strptime(last_inspection_date, '%Y-%m-%d')
-            due_date = last_date + timedelta(days=validity_months * 30)
-            today = datetime.now().date()
+            last_date = _parse_iso(last_inspection_date)
+            due_date = _add_months(last_date, validity_months)
+            today = _today()
             
-            return today > due_date.date()
+            return today > due_date
             
         except ValueError:
             return False
@@ -129,11 +187,11 @@ class DateValidator:
             if not last_inspection_date:
                 return 0
             
-            last_date = datetime.strptime(last_inspection_date, '%Y-%m-%d')
-            due_date = last_date + timedelta(days=validity_months * 30)
-            today = datetime.now().date()
+            last_date = _parse_iso(last_inspection_date)
+            due_date = _add_months(last_date, validity_months)
+            today = _today()
             
-            delta = due_date.date() - today
+            delta = due_date - today
             return delta.days
             
         except ValueError:
@@ -155,15 +213,15 @@ class DateValidator:
             if not date_str:
                 return ""
             
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-            today = datetime.now().date()
+            date_obj = _parse_iso(date_str)
+            today = _today()
             
             if format_type == 'short':
                 return date_obj.strftime('%d/%m/%Y')
             elif format_type == 'long':
                 return date_obj.strftime('%d de %B de %Y')
             elif format_type == 'relative':
-                delta = today - date_obj.date()
+                delta = today - date_obj
                 if delta.days == 0:
                     return "Hoje"
                 elif delta.days == 1:
@@ -181,13 +239,15 @@ class DateValidator:
             return date_str
     
     @staticmethod
-    def get_inspection_status(last_inspection_date: str, validity_months: int = 12) -> dict:
+    def get_inspection_status(last_inspection_date: str, validity_months: int = 12,
+                              today: Optional[date] = None) -> dict:
         """
         Retorna o status completo da inspeção
         
         Args:
             last_inspection_date: Data da última inspeção (YYYY-MM-DD)
             validity_months: Meses de validade (padrão: 12)
+            today: Data de referência (padrão: hoje); permite fixar um único "hoje" em lotes
             
         Returns:
             dict: Status da inspeção
@@ -203,10 +263,11 @@ class DateValidator:
                     'last_inspection_formatted': ''
                 }
             
-            last_date = datetime.strptime(last_inspection_date, '%Y-%m-%d')
-            next_date = last_date + timedelta(days=validity_months * 30)
-            today = datetime.now().date()
-            days_until_due = (next_date.date() - today).days
+            last_date = _parse_iso(last_inspection_date)
+            next_date = _add_months(last_date, validity_months)
+            if today is None:
+                today = _today()
+            days_until_due = (next_date - today).days
             
             # Determinar status
             if days_until_due < 0:
@@ -243,6 +304,32 @@ class DateValidator:
                 'last_inspection_formatted': ''
             }
     
+    @staticmethod
+    def bulk_status(dates: List[str], validity_months: int = 12) -> List[dict]:
+        """
+        Retorna o status de várias inspeções de uma vez
+        
+        Cada data distinta é processada uma única vez, o que evita repetir
+        o cálculo quando muitas inspeções compartilham a mesma data.
+        
+        Args:
+            dates: Datas da última inspeção (YYYY-MM-DD)
+            validity_months: Meses de validade (padrão: 12)
+            
+        Returns:
+            List[dict]: Status de cada inspeção, na mesma ordem de dates
+        """
+        today = _today()
+        statuses = {}
+        results = []
+        for last_inspection_date in dates:
+            status_info = statuses.get(last_inspection_date)
+            if status_info is None:
+                status_info = DateValidator.get_inspection_status(last_inspection_date, validity_months, today)
+                statuses[last_inspection_date] = status_info
+            results.append(dict(status_info))
+        return results
+    
     @staticmethod
     def validate_date_range(start_date: str, end_date: str) -> Tuple[bool, str]:
         """
@@ -259,8 +346,8 @@ class DateValidator:
             if not start_date or not end_date:
                 return False, "Ambas as datas são obrigatórias"
             
-            start = datetime.strptime(start_date, '%Y-%m-%d')
-            end = datetime.strptime(end_date, '%Y-%m-%d')
+            start = _parse_iso(start_date)
+            end = _parse_iso(end_date)
             
             if start > end:
                 return False, "Data inicial não pode ser posterior à data final"
@@ -273,6 +360,24 @@ class DateValidator:
         except ValueError:
             return False, "Formato de data inválido. Use YYYY-MM-DD"
     
+    @staticmethod
+    def iter_monthly_inspection_dates(year: int, month: int) -> Iterator[str]:
+        """
+        Percorre todas as datas de inspeção de um mês específico
+        
+        Args:
+            year: Ano
+            month: Mês (1-12)
+            
+        Returns:
+            Iterator[str]: Datas do mês (YYYY-MM-DD); ValueError se ano/mês inválido
+        """
+        # Valida ano e mês antes de gerar a primeira data
+        date(year, month, 1)
+        days_in_month = calendar.monthrange(year, month)[1]
+        for day in range(1, days_in_month + 1):
+            yield f"{year:04d}-{month:02d}-{day:02d}"
+    
     @staticmethod
     def get_monthly_inspection_dates(year: int, month: int) -> list:
         """
@@ -286,24 +391,7 @@ class DateValidator:
             list: Lista de datas de inspeção
         """
         try:
-            # Primeiro dia do mês
-            first_day = datetime(year, month, 1)
-            
-            # Último dia do mês
-            if month == 12:
-                last_day = datetime(year + 1, 1, 1) - timedelta(days=1)
-            else:
-                last_day = datetime(year, month + 1, 1) - timedelta(days=1)
-            
-            # Gerar todas as datas do mês
-            dates = []
-            current = first_day
-            while current <= last_day:
-                dates.append(current.strftime('%Y-%m-%d'))
-                current += timedelta(days=1)
-            
-            return dates
-            
+            return list(DateValidator.iter_monthly_inspection_dates(year, month))
         except ValueError:
             return []
     
@@ -320,18 +408,16 @@ class DateValidator:
             int: Número de dias úteis
         """
         try:
-            start = datetime.strptime(start_date, '%Y-%m-%d')
-            end = datetime.strptime(end_date, '%Y-%m-%d')
+            start = _parse_iso(start_date)
+            end = _parse_iso(end_date)
             
-            working_days = 0
-            current = start
-            
-            while current <= end:
-                if current.weekday() < 5:  # Segunda a Sexta
-                    working_days += 1
-                current += timedelta(days=1)
+            total_days = (end - start).days + 1
+            if total_days <= 0:
+                return 0
             
-            return working_days
+            # Semanas completas têm 5 dias úteis; o restante vem da tabela
+            weeks, remainder = divmod(total_days, 7)
+            return weeks * 5 + _EXTRA_WORKING_DAYS[start.weekday()][remainder]
             
         except ValueError:
             return 0
@@ -361,7 +447,7 @@ def add_days(date_str: str, days: int) -> str:
         str: Nova data (YYYY-MM-DD)
     """
     try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        date_obj = _parse_iso(date_str)
         new_date = date_obj + timedelta(days=days)
         return new_date.strftime('%Y-%m-%d')
     except ValueError:
@@ -8,16 +8,65 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from tkinter.scrolledtext import ScrolledText
 import os
+import functools
+import multiprocessing
+import queue
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional
+from PIL import Image, ImageTk
 
 # Importar nossos módulos
 from opcoes_formulario import get_todas_opcoes, get_estado_inicial, get_tags_por_tipo
 from database import InspectionDatabase
 from date_validator import DateValidator, is_vencido, add_days, format_date
-from photo_handler import PhotoHandler, PhotoPreview
+from photo_handler import PhotoHandler, PhotoPreview, load_thumbnail
 from report_generator import InspectionReportGenerator
 
+# Linhas carregadas por vez na lista de inspeções
+_PAGE_SIZE = 200
+
+# Intervalo mínimo entre atualizações do status durante a digitação (ms)
+_STATUS_DEBOUNCE_MS = 250
+
+# Texto do quadro de status da inspeção
+_STATUS_TEMPLATE = (
+    "📅 Última Inspeção: {}\n"
+    "⏰ Próxima Inspeção: {}\n"
+    "📊 Dias até Vencimento: {}\n"
+    "🔔 Status: {}"
+)
+
+# Tamanho da miniatura do preview (cache em disco compartilhado com o PhotoPreview)
+_PREVIEW_SIZE = (200, 200)
+
+def _make_thumb(photo_path, result_queue):
+    """Gera a miniatura do preview (ou reaproveita a do cache) fora da thread do Tk"""
+    try:
+        # BILINEAR é visualmente equivalente ao LANCZOS numa miniatura deste tamanho
+        thumb = load_thumbnail(photo_path, _PREVIEW_SIZE, Image.Resampling.BILINEAR)
+        result_queue.put((photo_path, thumb, None))
+    except Exception as e:
+        result_queue.put((photo_path, None, e))
+
+def _process_photo(photo_handler, photo_path, result_queue):
+    """Processa a foto selecionada fora da thread do Tk (erros vão pela fila)"""
+    try:
+        result_queue.put((photo_path, photo_handler.process_photo(photo_path), None))
+    except Exception as e:
+        result_queue.put((photo_path, None, e))
+
+def _import_csv(db_path, csv_path, result_queue):
+    """Importa o CSV fora da thread do Tk, em conexão própria (erros vão pela fila)"""
+    try:
+        db = InspectionDatabase(db_path)
+        try:
+            result_queue.put((db.import_inspections_csv(csv_path), None))
+        finally:
+            db.close()
+    except Exception as e:
+        result_queue.put((None, e))
+
 class InspectionFormApp:
     """Aplicação principal do sistema de inspeção"""
     
@@ -29,7 +78,6 @@ class InspectionFormApp:
         self.setup_ui()
         self.setup_photo_handler()
         self.setup_database()
-        self.setup_report_generator()
         
     def setup_main_window(self):
         """Configura a janela principal"""
@@ -75,6 +123,22 @@ class InspectionFormApp:
         self.tipo_dano_var = tk.StringVar()
         self.observacoes_var = tk.StringVar()
         
+        # Campos do formulário: (chave nos dados, variável, rótulo, obrigatório)
+        self.form_fields = (
+            ('plataforma', self.plataforma_var, 'Plataforma', True),
+            ('modulo', self.modulo_var, 'Módulo', True),
+            ('setor', self.setor_var, 'Setor', True),
+            ('tipoEquipamento', self.tipo_equipamento_var, 'Tipo de Equipamento', True),
+            ('tag', self.tag_var, 'TAG', False),
+            ('defeito', self.defeito_var, 'Defeito', True),
+            ('causa', self.causa_var, 'Causa', True),
+            ('categoriaRTI', self.categoria_rti_var, 'Categoria RTI', True),
+            ('recomendacao', self.recomendacao_var, 'Recomendação', True),
+            ('ultima', self.ultima_var, 'Data da Última Inspeção', True),
+            ('data', self.data_var, 'Data da Inspeção Atual', True),
+            ('tipoDano', self.tipo_dano_var, 'Tipo de Dano', True)
+        )
+        
         # Configurar data atual
         self.data_var.set(datetime.now().strftime('%Y-%m-%d'))
         
@@ -160,6 +224,13 @@ class InspectionFormApp:
         self.photo_preview_frame = ttk.Frame(form_frame)
         self.photo_preview_frame.grid(row=14, column=0, columnspan=2, pady=10)
         
+        # Labels do preview criados uma vez e apenas reconfigurados a cada foto
+        self.preview_photo = None  # Manter referência da imagem exibida
+        self.preview_label = ttk.Label(self.photo_preview_frame)
+        self.preview_label.pack()
+        self.preview_filename_label = ttk.Label(self.photo_preview_frame)
+        self.preview_filename_label.pack()
+        
         # Status da inspeção
         self.status_frame = ttk.LabelFrame(form_frame, text="📊 Status da Inspeção", padding="10")
         self.status_frame.grid(row=15, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
@@ -186,7 +257,11 @@ class InspectionFormApp:
         
         self.generate_batch_btn = ttk.Button(button_frame, text="📊 Gerar Relatórios em Lote", 
                                             command=self.generate_batch_reports)
-        self.generate_batch_btn.pack(side=tk.LEFT)
+        self.generate_batch_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.import_csv_btn = ttk.Button(button_frame, text="📥 Importar CSV", 
+                                        command=self.import_csv)
+        self.import_csv_btn.pack(side=tk.LEFT)
         
         # Configurar eventos
         self.setup_events()
@@ -213,6 +288,7 @@ class InspectionFormApp:
         self.tipo_equipamento_var.trace('w', self.on_tipo_equipamento_change)
         
         # Atualizar status quando data da última inspeção mudar
+        self.status_update_job = None
         self.ultima_var.trace('w', self.on_ultima_inspection_change)
         
         # Atalhos de teclado
@@ -224,6 +300,7 @@ class InspectionFormApp:
         """Configura o manipulador de fotos"""
         self.photo_handler = PhotoHandler()
         self.current_photo_path = None
+        self.pending_photo_source = None  # Foto original sendo processada em segundo plano
         
     def setup_database(self):
         """Configura o banco de dados"""
@@ -233,13 +310,12 @@ class InspectionFormApp:
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao conectar ao banco: {e}")
             
-    def setup_report_generator(self):
-        """Configura o gerador de relatórios"""
-        try:
-            self.report_generator = InspectionReportGenerator()
-            print("✅ Gerador de relatórios configurado")
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao configurar gerador de relatórios: {e}")
+    @functools.cached_property
+    def report_generator(self):
+        """Gerador de relatórios, criado apenas quando o primeiro PDF é solicitado"""
+        report_generator = InspectionReportGenerator()
+        print("✅ Gerador de relatórios configurado")
+        return report_generator
             
     def on_tipo_equipamento_change(self, *args):
         """Atualiza as TAGs disponíveis quando o tipo de equipamento muda"""
@@ -254,12 +330,19 @@ class InspectionFormApp:
             self.tag_combobox.config(state='readonly')
         else:
             # Desabilitar e limpar TAG se não houver tipo selecionado
-            self.tag_combobox['values'] = []
+            self.tag_combobox['values'] = ()
             self.tag_var.set('')
             self.tag_combobox.config(state='disabled')
             
     def on_ultima_inspection_change(self, *args):
-        """Atualiza o status quando a data da última inspeção muda"""
+        """Agenda a atualização do status, agrupando alterações em sequência (digitação)"""
+        if self.status_update_job is not None:
+            self.root.after_cancel(self.status_update_job)
+        self.status_update_job = self.root.after(_STATUS_DEBOUNCE_MS, self.apply_ultima_inspection_change)
+        
+    def apply_ultima_inspection_change(self):
+        """Atualiza o status com a data da última inspeção atual"""
+        self.status_update_job = None
         ultima = self.ultima_var.get()
         if ultima:
             self.update_inspection_status(ultima)
@@ -270,12 +353,12 @@ class InspectionFormApp:
             status_info = DateValidator.get_inspection_status(ultima_data, 12)
             
             # Criar texto do status
-            status_text = f"""
-📅 Última Inspeção: {status_info.get('last_inspection_formatted', 'N/A')}
-⏰ Próxima Inspeção: {status_info.get('next_inspection_formatted', 'N/A')}
-📊 Dias até Vencimento: {status_info.get('days_until_due', 'N/A')}
-🔔 Status: {status_info.get('message', 'N/A')}
-            """.strip()
+            status_text = _STATUS_TEMPLATE.format(
+                status_info.get('last_inspection_formatted', 'N/A'),
+                status_info.get('next_inspection_formatted', 'N/A'),
+                status_info.get('days_until_due', 'N/A'),
+                status_info.get('message', 'N/A')
+            )
             
             # Configurar cor baseada no status
             status = status_info.get('status', 'unknown')
@@ -297,49 +380,93 @@ class InspectionFormApp:
     def select_photo(self):
         """Seleciona uma foto"""
         try:
-            photo_path = self.photo_handler.select_photo(self.root)
-            if photo_path:
-                self.current_photo_path = photo_path
-                self.show_photo_preview(photo_path)
-                messagebox.showinfo("Sucesso", "Foto selecionada com sucesso!")
+            source_path = self.photo_handler.ask_photo_path(self.root)
+            if not source_path:
+                return
+                
+            self.pending_photo_source = source_path
+            self.preview_label.configure(image='', text="⏳ Processando foto...")
+            self.preview_filename_label.configure(text='')
+            
+            # Redimensionamento em segundo plano; o Tk só é tocado na thread principal
+            result_queue = queue.Queue()
+            threading.Thread(target=_process_photo, args=(self.photo_handler, source_path, result_queue),
+                             daemon=True).start()
+            self.root.after(50, self.poll_photo_processing, result_queue)
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao selecionar foto: {e}")
             
+    def poll_photo_processing(self, result_queue):
+        """Aplica a foto processada quando a thread de processamento terminar"""
+        try:
+            source_path, photo_path, error = result_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self.poll_photo_processing, result_queue)
+            return
+            
+        # Outra foto selecionada (ou foto limpa) enquanto esta era processada
+        if source_path != self.pending_photo_source:
+            return
+        self.pending_photo_source = None
+        
+        if error:
+            # Restaurar o preview da foto anterior, se houver
+            if self.current_photo_path:
+                self.show_photo_preview(self.current_photo_path)
+            else:
+                self.preview_label.configure(text='')
+            messagebox.showerror("Erro", f"Erro ao processar foto: {error}")
+            return
+            
+        self.current_photo_path = photo_path
+        self.show_photo_preview(photo_path)
+        messagebox.showinfo("Sucesso", "Foto selecionada com sucesso!")
+            
     def show_photo_preview(self, photo_path):
         """Mostra preview da foto"""
         # Limpar preview anterior
-        for widget in self.photo_preview_frame.winfo_children():
-            widget.destroy()
+        self.preview_photo = None
+        self.preview_label.configure(image='', text="⏳ Carregando preview...")
+        self.preview_filename_label.configure(text='')
+        
+        # Miniatura gerada em segundo plano; o Tk só é tocado na thread principal
+        result_queue = queue.Queue()
+        threading.Thread(target=_make_thumb, args=(photo_path, result_queue), daemon=True).start()
+        self.root.after(50, self.poll_photo_preview, result_queue)
+        
+    def poll_photo_preview(self, result_queue):
+        """Exibe a miniatura quando a thread de geração terminar"""
+        try:
+            photo_path, thumb, error = result_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self.poll_photo_preview, result_queue)
+            return
+            
+        # Foto trocada ou removida enquanto a miniatura era gerada
+        if photo_path != self.current_photo_path:
+            return
+            
+        if error:
+            self.preview_label.configure(text=f"Erro ao carregar preview: {error}")
+            return
             
-        # Criar novo preview
         try:
-            from PIL import Image, ImageTk
+            self.preview_photo = ImageTk.PhotoImage(thumb)
             
-            # Abrir e redimensionar imagem
-            with Image.open(photo_path) as img:
-                img.thumbnail((200, 200), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                # Label para exibir a foto
-                photo_label = ttk.Label(self.photo_preview_frame, image=photo)
-                photo_label.image = photo  # Manter referência
-                photo_label.pack()
-                
-                # Nome do arquivo
-                filename_label = ttk.Label(self.photo_preview_frame, 
-                                         text=os.path.basename(photo_path))
-                filename_label.pack()
+            # Foto e nome do arquivo
+            self.preview_label.configure(image=self.preview_photo, text='')
+            self.preview_filename_label.configure(text=os.path.basename(photo_path))
                 
         except Exception as e:
-            error_label = ttk.Label(self.photo_preview_frame, 
-                                   text=f"Erro ao carregar preview: {e}")
-            error_label.pack()
+            self.preview_label.configure(text=f"Erro ao carregar preview: {e}")
             
     def clear_photo(self):
         """Limpa a foto selecionada"""
         self.current_photo_path = None
-        for widget in self.photo_preview_frame.winfo_children():
-            widget.destroy()
+        self.pending_photo_source = None
+        self.preview_photo = None
+        self.preview_label.configure(image='', text='')
+        self.preview_filename_label.configure(text='')
             
     def save_inspection(self):
         """Salva a inspeção e gera PDF"""
@@ -371,23 +498,8 @@ class InspectionFormApp:
             
     def validate_form(self):
         """Valida os campos obrigatórios"""
-        required_fields = [
-            ('plataforma_var', 'Plataforma'),
-            ('modulo_var', 'Módulo'),
-            ('setor_var', 'Setor'),
-            ('tipo_equipamento_var', 'Tipo de Equipamento'),
-            ('defeito_var', 'Defeito'),
-            ('causa_var', 'Causa'),
-            ('categoria_rti_var', 'Categoria RTI'),
-            ('recomendacao_var', 'Recomendação'),
-            ('ultima_var', 'Data da Última Inspeção'),
-            ('data_var', 'Data da Inspeção Atual'),
-            ('tipo_dano_var', 'Tipo de Dano')
-        ]
-        
-        for field_var, field_name in required_fields:
-            value = getattr(self, field_var).get().strip()
-            if not value:
+        for _, var, field_name, required in self.form_fields:
+            if required and not var.get().strip():
                 messagebox.showerror("Validação", f"Campo '{field_name}' é obrigatório!")
                 return False
                 
@@ -395,33 +507,19 @@ class InspectionFormApp:
         
     def collect_form_data(self):
         """Coleta os dados do formulário"""
-        return {
-            'plataforma': self.plataforma_var.get().strip(),
-            'modulo': self.modulo_var.get().strip(),
-            'setor': self.setor_var.get().strip(),
-            'tipoEquipamento': self.tipo_equipamento_var.get().strip(),
-            'tag': self.tag_var.get().strip(),
-            'defeito': self.defeito_var.get().strip(),
-            'causa': self.causa_var.get().strip(),
-            'categoriaRTI': self.categoria_rti_var.get().strip(),
-            'recomendacao': self.recomendacao_var.get().strip(),
-            'ultima': self.ultima_var.get().strip(),
-            'data': self.data_var.get().strip(),
-            'tipoDano': self.tipo_dano_var.get().strip(),
-            'observacoes': self.observacoes_text.get('1.0', tk.END).strip(),
-            'foto_path': self.current_photo_path or ''
-        }
+        data = {key: var.get().strip() for key, var, _, _ in self.form_fields}
+        data['observacoes'] = self.observacoes_text.get('1.0', tk.END).strip()
+        data['foto_path'] = self.current_photo_path or ''
+        return data
         
     def clear_form(self):
         """Limpa o formulário"""
         # Limpar variáveis
-        for var_name in ['plataforma_var', 'modulo_var', 'setor_var', 'tipo_equipamento_var',
-                        'tag_var', 'defeito_var', 'causa_var', 'categoria_rti_var',
-                        'recomendacao_var', 'ultima_var', 'data_var', 'tipo_dano_var']:
-            getattr(self, var_name).set('')
+        for _, var, _, _ in self.form_fields:
+            var.set('')
             
         # Limpar TAG combobox
-        self.tag_combobox['values'] = []
+        self.tag_combobox['values'] = ()
         self.tag_combobox.config(state='disabled')
             
         # Limpar observações
@@ -440,18 +538,18 @@ class InspectionFormApp:
     def view_all_inspections(self):
         """Mostra todas as inspeções"""
         try:
-            inspections = self.db.get_all_inspections()
-            if not inspections:
+            total = self.db.count_inspections()
+            if not total:
                 messagebox.showinfo("Informação", "Nenhuma inspeção encontrada.")
                 return
                 
             # Criar janela de visualização
-            self.create_inspections_window(inspections)
+            self.create_inspections_window(total)
             
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao buscar inspeções: {e}")
             
-    def create_inspections_window(self, inspections):
+    def create_inspections_window(self, total):
         """Cria janela para visualizar inspeções"""
         window = tk.Toplevel(self.root)
         window.title("👁️ Todas as Inspeções")
@@ -462,7 +560,7 @@ class InspectionFormApp:
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Título
-        title_label = ttk.Label(main_frame, text=f"📊 Total de Inspeções: {len(inspections)}",
+        title_label = ttk.Label(main_frame, text=f"📊 Total de Inspeções: {total}",
                                font=('Arial', 14, 'bold'))
         title_label.pack(pady=(0, 20))
         
@@ -475,28 +573,21 @@ class InspectionFormApp:
             tree.heading(col, text=col)
             tree.column(col, width=100)
             
-        # Adicionar dados
-        for inspection in inspections:
-            # Calcular status
-            ultima = inspection.get('ultima_inspecao', '')
-            if ultima:
-                status_info = DateValidator.get_inspection_status(ultima, 12)
-                status = status_info.get('message', 'N/A')
-            else:
-                status = 'N/A'
-                
-            tree.insert('', 'end', values=(
-                inspection.get('id', 'N/A'),
-                inspection.get('tag', 'N/A'),
-                inspection.get('tipo_equipamento', 'N/A'),
-                inspection.get('plataforma', 'N/A'),
-                inspection.get('data_inspecao', 'N/A'),
-                status
-            ))
-            
         # Scrollbar
         scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
+        
+        def on_tree_scroll(first, last):
+            scrollbar.set(first, last)
+            # Perto do fim da lista: buscar a próxima página
+            if float(last) > 0.9:
+                self.load_inspections_page(tree)
+                
+        tree.configure(yscrollcommand=on_tree_scroll)
+        
+        # Carregar apenas a primeira página; as demais vêm com a rolagem
+        tree.loaded_rows = 0
+        tree.all_loaded = False
+        self.load_inspections_page(tree)
         
         # Layout
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -509,35 +600,34 @@ class InspectionFormApp:
         ttk.Button(button_frame, text="🔄 Atualizar", 
                   command=lambda: self.refresh_inspections(tree)).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="📊 Gerar Relatório Resumo", 
-                  command=lambda: self.generate_summary_report(inspections)).pack(side=tk.LEFT)
+                  command=lambda: self.generate_summary_report(self.db.get_all_inspections())).pack(side=tk.LEFT)
+        
+    def load_inspections_page(self, tree):
+        """Carrega a próxima página de inspeções no Treeview"""
+        if tree.all_loaded:
+            return
+            
+        # Linhas: (id, tag, tipo, plataforma, data, última inspeção)
+        rows = self.db.get_inspection_list(limit=_PAGE_SIZE, offset=tree.loaded_rows)
+        
+        # Calcular status da página de uma vez (cada data distinta é processada uma única vez)
+        statuses = DateValidator.bulk_status([row[5] for row in rows], 12)
+        
+        for (*values, ultima), status_info in zip(rows, statuses):
+            status = status_info.get('message', 'N/A') if ultima else 'N/A'
+            tree.insert('', 'end', values=(*values, status))
+            
+        tree.loaded_rows += len(rows)
+        tree.all_loaded = len(rows) < _PAGE_SIZE
         
     def refresh_inspections(self, tree):
         """Atualiza a lista de inspeções"""
         try:
-            # Limpar tree
-            for item in tree.get_children():
-                tree.delete(item)
-                
-            # Buscar inspeções atualizadas
-            inspections = self.db.get_all_inspections()
-            
-            # Adicionar dados atualizados
-            for inspection in inspections:
-                ultima = inspection.get('ultima_inspecao', '')
-                if ultima:
-                    status_info = DateValidator.get_inspection_status(ultima, 12)
-                    status = status_info.get('message', 'N/A')
-                else:
-                    status = 'N/A'
-                    
-                tree.insert('', 'end', values=(
-                    inspection.get('id', 'N/A'),
-                    inspection.get('tag', 'N/A'),
-                    inspection.get('tipo_equipamento', 'N/A'),
-                    inspection.get('plataforma', 'N/A'),
-                    inspection.get('data_inspecao', 'N/A'),
-                    status
-                ))
+            # Limpar tree e recarregar a partir da primeira página
+            tree.delete(*tree.get_children())
+            tree.loaded_rows = 0
+            tree.all_loaded = False
+            self.load_inspections_page(tree)
                 
             messagebox.showinfo("Sucesso", "Lista atualizada!")
             
@@ -546,29 +636,141 @@ class InspectionFormApp:
             
     def generate_batch_reports(self):
         """Gera relatórios em lote"""
+        job = None
         try:
-            inspections = self.db.get_all_inspections()
-            if not inspections:
+            total = self.db.count_inspections()
+            if not total:
                 messagebox.showinfo("Informação", "Nenhuma inspeção encontrada para gerar relatórios.")
                 return
                 
             # Confirmar ação
             result = messagebox.askyesno("Confirmação", 
-                                       f"Gerar relatórios para {len(inspections)} inspeções?\n"
+                                       f"Gerar relatórios para {total} inspeções?\n"
                                        "Isso pode demorar alguns minutos.")
             if not result:
                 return
                 
-            # Gerar relatórios
-            pdf_files = self.report_generator.generate_batch_reports(inspections)
+            # PDFs gerados em paralelo pelo gerador (um processo por núcleo);
+            # inspeções lidas do banco em lotes, sem montar a lista completa antes
+            job = self.report_generator.start_batch_reports(self.db.iter_all_inspections())
             
-            messagebox.showinfo("Sucesso", 
-                               f"Relatórios gerados com sucesso!\n"
-                               f"Total: {len(pdf_files)} arquivos")
+            # Janela de progresso; fechá-la cancela os relatórios pendentes
+            progress_window = tk.Toplevel(self.root)
+            progress_window.title("📊 Gerando Relatórios")
+            progress_window.transient(self.root)
+            progress_window.protocol("WM_DELETE_WINDOW",
+                                     functools.partial(self.finish_batch_reports, job, progress_window))
+            
+            progress_label = ttk.Label(progress_window, text=f"0/{total} relatórios")
+            progress_label.pack(padx=20, pady=(20, 10))
+            
+            progressbar = ttk.Progressbar(progress_window, length=300, maximum=total)
+            progressbar.pack(padx=20, pady=(0, 20))
+            
+            self.generate_batch_btn.config(state='disabled')
+            self.poll_batch_reports(job, total, progress_window, progress_label, progressbar)
                                
         except Exception as e:
+            if job is not None:
+                job.cancel()
             messagebox.showerror("Erro", f"Erro ao gerar relatórios em lote: {e}")
             
+    def poll_batch_reports(self, job, total, progress_window, progress_label, progressbar):
+        """Acompanha a geração em lote sem bloquear a interface"""
+        # Lote já encerrado pelo fechamento da janela
+        if job.cancelled:
+            return
+            
+        try:
+            for i, _, error in job.poll():
+                if error is not None:
+                    print(f"❌ Erro ao gerar relatório {i}: {error}")
+            
+            if not progress_window.winfo_exists():
+                self.finish_batch_reports(job, progress_window)
+                return
+            progressbar['value'] = job.done
+            progress_label.config(text=f"{job.done}/{total} relatórios")
+        except Exception as e:
+            # Pool quebrado ou janela destruída: encerrar sem deixar o lote pendurado
+            print(f"❌ Erro ao acompanhar relatórios em lote: {e}")
+            self.finish_batch_reports(job, progress_window)
+            return
+        
+        if not job.finished:
+            self.root.after(100, self.poll_batch_reports, job, total,
+                            progress_window, progress_label, progressbar)
+            return
+            
+        self.finish_batch_reports(job, progress_window)
+        
+    def finish_batch_reports(self, job, progress_window):
+        """Encerra o lote (concluído ou cancelado), libera o pool e mostra o resultado"""
+        if not job.finished:
+            job.cancel()
+            print(f"🛑 Geração em lote cancelada após {job.done} relatórios")
+            
+        if progress_window.winfo_exists():
+            progress_window.destroy()
+        self.generate_batch_btn.config(state='normal')
+        
+        generated = len(job.generated)
+        if job.errors:
+            i, error = job.errors[0]
+            messagebox.showwarning("Atenção",
+                                   f"{generated} relatórios gerados, {len(job.errors)} com erro.\n"
+                                   f"Primeiro erro (relatório {i}): {error}")
+        elif job.cancelled:
+            messagebox.showinfo("Cancelado",
+                                f"Geração cancelada.\n"
+                                f"Total: {generated} arquivos gerados")
+        else:
+            messagebox.showinfo("Sucesso", 
+                               f"Relatórios gerados com sucesso!\n"
+                               f"Total: {generated} arquivos")
+            
+    def import_csv(self):
+        """Importa inspeções de um arquivo CSV"""
+        try:
+            csv_path = filedialog.askopenfilename(
+                title="Selecionar arquivo CSV",
+                filetypes=[
+                    ("CSV", "*.csv"),
+                    ("Todos os arquivos", "*.*")
+                ]
+            )
+            if not csv_path:
+                return
+                
+            # Importação em segundo plano; o Tk só é tocado na thread principal
+            self.import_csv_btn.configure(state=tk.DISABLED)
+            result_queue = queue.Queue()
+            threading.Thread(target=_import_csv, args=(self.db.db_path, csv_path, result_queue),
+                             daemon=True).start()
+            self.root.after(50, self.poll_csv_import, result_queue)
+            
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao importar CSV: {e}")
+            
+    def poll_csv_import(self, result_queue):
+        """Informa o resultado quando a thread de importação terminar"""
+        try:
+            total, error = result_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self.poll_csv_import, result_queue)
+            return
+            
+        self.import_csv_btn.configure(state=tk.NORMAL)
+        
+        if error:
+            # A importação é atômica: nenhuma linha do arquivo foi gravada
+            messagebox.showerror("Erro", f"Erro ao importar CSV (nenhuma inspeção importada): {error}")
+            return
+            
+        # Gravado por outra conexão: o cache de leitura desta está desatualizado
+        self.db.clear_cache()
+        messagebox.showinfo("Sucesso", f"{total} inspeções importadas!")
+            
     def generate_summary_report(self, inspections):
         """Gera relatório resumo"""
         try:
@@ -603,4 +805,7 @@ def main():
         messagebox.showerror("Erro Fatal", f"Erro ao iniciar aplicação: {e}")
 
 if __name__ == "__main__":
+    # Relatórios em lote usam processos: no executável do PyInstaller (spawn no
+    # Windows) cada worker reexecutaria o programa e abriria outra janela do Tk
+    multiprocessing.freeze_support()
     main()
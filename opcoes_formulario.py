@@ -4,25 +4,33 @@ Opções do formulário de inspeção
 Baseado no projeto React original
 """
 
-# Opções para os campos do formulário
+from types import MappingProxyType
+
+# TAGs por tipo de equipamento (geradas uma única vez, imutáveis)
+_TAGS_BY_TIPO = {
+    'Vaso de Pressão': tuple(f'VP-{i:03d}' for i in range(1, 51)),
+    'Tanque': tuple(f'TQ-{i:03d}' for i in range(1, 41)),
+    'Permutador': tuple(f'PM-{i:03d}' for i in range(1, 31)),
+    'Filtro': tuple(f'FT-{i:03d}' for i in range(1, 101)),
+}
+
+# Opções para os campos do formulário (tuplas compartilhadas diretamente com os widgets)
 OPCOES_FORMULARIO = {
-    'plataforma': ['P-1', 'P-2', 'P-3', 'P-4'],
-    'modulo': ['M01', 'M02', 'M03', 'M04', 'M05', 'M06', 'M07', 'M08', 'M09', 'M10'],
-    'setor': ['S01', 'S02', 'S03'],
-    'tipoEquipamento': ['Vaso de Pressão', 'Tanque', 'Permutador', 'Filtro'],
-    'tag': {
-        'Vaso de Pressão': [f'VP-{str(i+1).zfill(3)}' for i in range(50)],
-        'Tanque': [f'TQ-{str(i+1).zfill(3)}' for i in range(40)],
-        'Permutador': [f'PM-{str(i+1).zfill(3)}' for i in range(30)],
-        'Filtro': [f'FT-{str(i+1).zfill(3)}' for i in range(100)],
-    },
-    'defeito': ['Redução de espessura', 'Vazamento', 'Trinca', 'Desgaste anormal', 'Outro'],
-    'causa': ['Corrosão externa', 'Corrosão interna', 'Vibração excessiva', 'Impacto', 'Outro'],
-    'categoriaRTI': ['I', 'II', 'III', 'IV'],
-    'recomendacao': ['Reparar imediatamente', 'Estender prazo de execução', 'Interromper o serviço', 'Pintura', 'Outra'],
-    'tipoDano': ['Localizado', 'Disperso', 'Generalizado']
+    'plataforma': ('P-1', 'P-2', 'P-3', 'P-4'),
+    'modulo': ('M01', 'M02', 'M03', 'M04', 'M05', 'M06', 'M07', 'M08', 'M09', 'M10'),
+    'setor': ('S01', 'S02', 'S03'),
+    'tipoEquipamento': ('Vaso de Pressão', 'Tanque', 'Permutador', 'Filtro'),
+    'tag': MappingProxyType(_TAGS_BY_TIPO),
+    'defeito': ('Redução de espessura', 'Vazamento', 'Trinca', 'Desgaste anormal', 'Outro'),
+    'causa': ('Corrosão externa', 'Corrosão interna', 'Vibração excessiva', 'Impacto', 'Outro'),
+    'categoriaRTI': ('I', 'II', 'III', 'IV'),
+    'recomendacao': ('Reparar imediatamente', 'Estender prazo de execução', 'Interromper o serviço', 'Pintura', 'Outra'),
+    'tipoDano': ('Localizado', 'Disperso', 'Generalizado')
 }
 
+# Visão somente leitura entregue aos chamadores (sem cópias defensivas)
+_OPCOES_VIEW = MappingProxyType(OPCOES_FORMULARIO)
+
 # Estado inicial do formulário
 ESTADO_INICIAL = {
     'plataforma': '',
@@ -43,11 +51,11 @@ ESTADO_INICIAL = {
 
 def get_tags_por_tipo(tipo_equipamento):
     """Retorna as tags disponíveis para um tipo de equipamento"""
-    return OPCOES_FORMULARIO['tag'].get(tipo_equipamento, [])
+    return _TAGS_BY_TIPO.get(tipo_equipamento, ())
 
 def get_todas_opcoes():
-    """Retorna todas as opções do formulário"""
-    return OPCOES_FORMULARIO
+    """Retorna todas as opções do formulário (somente leitura)"""
+    return _OPCOES_VIEW
 
 def get_estado_inicial():
     """Retorna o estado inicial do formulário"""
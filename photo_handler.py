@@ -6,11 +6,233 @@ Substitui o sistema de upload do React
 
 import os
 import shutil
+import functools
+import hashlib
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Tuple, List
-from PIL import Image, ImageTk
-import tkinter as tk
-from tkinter import filedialog, messagebox
+from typing import TYPE_CHECKING, Optional, Tuple, List
+from PIL import Image, UnidentifiedImageError, features
+
+# tkinter e ImageTk são importados só onde há interface, para que o módulo
+# funcione em servidores sem Tk (processamento em lote, listagem de fotos)
+if TYPE_CHECKING:
+    from PIL import ImageTk
+
+# Filtro usado em todos os redimensionamentos (com Pillow-SIMD o LANCZOS é vetorizado)
+RESAMPLE = Image.Resampling.LANCZOS
+
+# Contador do processo para nomes únicos mesmo com várias fotos no mesmo segundo
+# (next() em itertools.count é atômico, seguro nas threads do process_many)
+_UID = itertools.count()
+
+# Acima disso (~20 MP), fontes não-JPEG são pré-reduzidas por média de blocos
+_BOX_REDUCE_PIXELS = 20_000_000
+
+# Cache único das miniaturas de preview, fora do diretório de fotos:
+# <sha256(caminho:mtime:LxA)>.png
+_THUMB_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'inspecao', 'thumbs')
+
+# Tamanho máximo do cache; ao ultrapassar, as miniaturas mais antigas são
+# removidas até sobrar _THUMB_CACHE_PRUNE_TO do limite
+_THUMB_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_THUMB_CACHE_PRUNE_TO = 0.8
+
+# Intervalo mínimo entre varreduras do cache para a limpeza (segundos)
+_THUMB_CACHE_PRUNE_INTERVAL = 60.0
+_prune_lock = threading.Lock()
+_last_prune = 0.0
+
+# Threads para listar subdiretórios de fotos em paralelo (scandir libera o GIL)
+_SCAN_WORKERS = 8
+
+@functools.lru_cache(maxsize=1)
+def _has_libjpeg_turbo() -> bool:
+    """Verifica (uma única vez) se o Pillow foi compilado com libjpeg-turbo"""
+    has_turbo = bool(features.check_feature('libjpeg_turbo'))
+    if not has_turbo:
+        print("⚠️ Pillow sem libjpeg-turbo: codificação/decodificação de JPEG será mais lenta")
+    return has_turbo
+
+def _draft_jpeg(img: Image.Image, size: Tuple[int, int]):
+    """
+    Pede ao libjpeg uma decodificação já reduzida (escala DCT 1/2, 1/4 ou 1/8)
+    
+    O resultado nunca fica menor que size; para outros formatos não faz nada.
+    Deve ser chamado antes de a imagem ser carregada.
+    """
+    if img.format == 'JPEG':
+        img.draft(img.mode, size)
+
+def _thumb_cache_path(photo_path: str, max_size: Tuple[int, int]) -> str:
+    """
+    Caminho da miniatura no cache
+    
+    A chave inclui a data de modificação, então uma foto alterada gera outra miniatura.
+    """
+    key = f"{os.path.abspath(photo_path)}:{os.path.getmtime(photo_path)}:{max_size[0]}x{max_size[1]}"
+    return os.path.join(_THUMB_CACHE_DIR, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.png')
+
+def _prune_thumb_cache():
+    """Remove as miniaturas mais antigas quando o cache passa do tamanho máximo"""
+    global _last_prune
+    with _prune_lock:
+        now = time.monotonic()
+        if _last_prune and now - _last_prune < _THUMB_CACHE_PRUNE_INTERVAL:
+            return
+        _last_prune = now
+    
+    entries = []
+    total = 0
+    try:
+        with os.scandir(_THUMB_CACHE_DIR) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+    except OSError:
+        return
+    
+    if total <= _THUMB_CACHE_MAX_BYTES:
+        return
+    
+    entries.sort()
+    target = _THUMB_CACHE_MAX_BYTES * _THUMB_CACHE_PRUNE_TO
+    for _, size, path in entries:
+        if total <= target:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        total -= size
+
+def load_thumbnail(photo_path: str, max_size: Tuple[int, int],
+                   resample: Image.Resampling = RESAMPLE) -> Image.Image:
+    """
+    Retorna a miniatura da foto, do cache em disco ou gerada (e gravada no cache)
+    
+    Seguro para chamar de threads de trabalho: não toca no Tk.
+    
+    Args:
+        photo_path: Caminho da foto
+        max_size: Tamanho máximo da miniatura (largura, altura)
+        resample: Filtro usado ao gerar a miniatura
+        
+    Returns:
+        Image.Image: Miniatura já carregada na memória
+        
+    Raises:
+        FileNotFoundError: Se a foto não existir
+    """
+    cache_path = _thumb_cache_path(photo_path, max_size)
+    
+    # Abre direto (sem exists() antes): a ausência do arquivo é o caso de cache vazio
+    try:
+        with Image.open(cache_path) as cached:
+            cached.load()
+            return cached
+    except FileNotFoundError:
+        pass
+    except (OSError, UnidentifiedImageError):
+        # PNG truncado ou corrompido (gravação interrompida): descartar e regenerar
+        try:
+            os.unlink(cache_path)
+        except OSError:
+            pass
+    
+    with Image.open(photo_path) as img:
+        _draft_jpeg(img, max_size)
+        img.thumbnail(max_size, resample)
+        if img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+            img = img.convert('RGB')
+        
+        # Falhas na gravação apenas desativam o cache
+        try:
+            os.makedirs(_THUMB_CACHE_DIR, exist_ok=True)
+            # Arquivo temporário único + rename: outra thread ou processo nunca lê um PNG incompleto
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            img.save(tmp_path, 'PNG')
+            os.replace(tmp_path, cache_path)
+            _prune_thumb_cache()
+        except Exception as e:
+            print(f"⚠️ Não foi possível gravar a miniatura no cache: {e}")
+        
+        return img
+
+def _box_reduce(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """
+    Pré-reduz fontes não-JPEG muito grandes por média de blocos (BOX)
+    
+    O equivalente ao draft() para PNG/TIFF: um fator inteiro que mantém a imagem
+    com pelo menos o dobro do tamanho final, para o LANCZOS refinar depois.
+    Conversão de modo e redimensionamento passam a trabalhar no buffer menor,
+    e o buffer completo é liberado logo em seguida.
+    
+    Args:
+        img: Imagem já carregada
+        size: Tamanho máximo final (largura, altura)
+        
+    Returns:
+        Image.Image: Imagem reduzida (ou a própria, se não for o caso)
+    """
+    if img.format == 'JPEG' or img.width * img.height <= _BOX_REDUCE_PIXELS:
+        return img
+    if img.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+        return img
+    
+    factor = int(max(img.width / size[0], img.height / size[1]) / 2)
+    if factor < 2:
+        return img
+    
+    reduced = img.reduce(factor)
+    img.close()
+    return reduced
+
+@functools.lru_cache(maxsize=1)
+def _load_cv2():
+    """
+    Importa o OpenCV (opcional) no primeiro uso, uma única vez
+    
+    O import do cv2 é o mais lento da aplicação; fica fora do carregamento do módulo.
+    
+    Returns:
+        Tupla (cv2, numpy) ou None se o OpenCV não estiver instalado
+    """
+    try:
+        import cv2
+        import numpy as np
+    except ImportError:
+        return None
+    return cv2, np
+
+def _fit_size(img_size: Tuple[int, int], max_size: Tuple[int, int]) -> Tuple[int, int]:
+    """Tamanho que cabe em max_size mantendo a proporção (mesma regra do thumbnail)"""
+    scale = min(max_size[0] / img_size[0], max_size[1] / img_size[1])
+    return max(1, round(img_size[0] * scale)), max(1, round(img_size[1] * scale))
+
+def _resize_cv2(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """
+    Reduz a imagem com cv2.resize INTER_AREA (média por área, SIMD)
+    
+    Só deve ser chamada quando _load_cv2() encontrou o OpenCV.
+    
+    Args:
+        img: Imagem RGB ou L
+        size: Tamanho máximo final (largura, altura)
+        
+    Returns:
+        Image.Image: Nova imagem reduzida
+    """
+    cv2, np = _load_cv2()
+    arr = cv2.resize(np.asarray(img), _fit_size(img.size, size), interpolation=cv2.INTER_AREA)
+    return Image.fromarray(arr)
 
 class PhotoHandler:
     """Classe para manipulação de fotos"""
@@ -24,10 +246,15 @@ class PhotoHandler:
         """
         self.photos_dir = photos_dir
         self.supported_formats = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']
+        self._fmt_tuple = tuple(self.supported_formats)  # Para str.endswith
+        self._fmt_set = frozenset(self.supported_formats)  # Para testes de pertinência
         self.max_file_size = 10 * 1024 * 1024  # 10MB
         self.max_dimensions = (1920, 1080)  # Máximo 1920x1080
         self.thumbnail_size = (300, 300)  # Tamanho do thumbnail
         
+        # Avisar se o backend de JPEG não é o acelerado
+        _has_libjpeg_turbo()
+        
         # Criar diretório de fotos se não existir
         self._ensure_photos_directory()
     
@@ -52,19 +279,7 @@ class PhotoHandler:
             str: Caminho da foto selecionada ou None
         """
         try:
-            file_path = filedialog.askopenfilename(
-                parent=parent_window,
-                title="Selecionar Foto",
-                filetypes=[
-                    ("Imagens", "*.jpg *.jpeg *.png *.gif *.bmp *.tiff"),
-                    ("JPEG", "*.jpg *.jpeg"),
-                    ("PNG", "*.png"),
-                    ("GIF", "*.gif"),
-                    ("BMP", "*.bmp"),
-                    ("TIFF", "*.tiff"),
-                    ("Todos os arquivos", "*.*")
-                ]
-            )
+            file_path = self.ask_photo_path(parent_window)
             
             if file_path:
                 return self.validate_and_process_photo(file_path)
@@ -72,9 +287,36 @@ class PhotoHandler:
             
         except Exception as e:
             print(f"❌ Erro ao selecionar foto: {e}")
+            from tkinter import messagebox
             messagebox.showerror("Erro", f"Erro ao selecionar foto: {e}")
             return None
     
+    def ask_photo_path(self, parent_window=None) -> Optional[str]:
+        """
+        Abre o diálogo de seleção de foto, sem processá-la
+        
+        Args:
+            parent_window: Janela pai para o diálogo
+            
+        Returns:
+            str: Caminho do arquivo escolhido ou None
+        """
+        from tkinter import filedialog
+        
+        return filedialog.askopenfilename(
+            parent=parent_window,
+            title="Selecionar Foto",
+            filetypes=[
+                ("Imagens", "*.jpg *.jpeg *.png *.gif *.bmp *.tiff"),
+                ("JPEG", "*.jpg *.jpeg"),
+                ("PNG", "*.png"),
+                ("GIF", "*.gif"),
+                ("BMP", "*.bmp"),
+                ("TIFF", "*.tiff"),
+                ("Todos os arquivos", "*.*")
+            ]
+        ) or None
+    
     def validate_and_process_photo(self, file_path: str) -> Optional[str]:
         """
         Valida e processa uma foto selecionada
@@ -93,17 +335,64 @@ class PhotoHandler:
             # Processar e salvar foto
             processed_path = self._process_and_save_photo(file_path)
             
-            if processed_path:
-                print(f"✅ Foto processada e salva: {processed_path}")
-                return processed_path
-            else:
-                return None
+            print(f"✅ Foto processada e salva: {processed_path}")
+            return processed_path
                 
         except Exception as e:
             print(f"❌ Erro ao processar foto: {e}")
+            from tkinter import messagebox
             messagebox.showerror("Erro", f"Erro ao processar foto: {e}")
             return None
     
+    def process_photo(self, file_path: str) -> str:
+        """
+        Valida e processa uma foto sem exibir diálogos
+        
+        Seguro para chamar fora da thread principal do Tk; os erros são
+        levantados para que o chamador decida como exibi-los.
+        
+        Args:
+            file_path: Caminho da foto original
+            
+        Returns:
+            str: Caminho da foto processada
+            
+        Raises:
+            ValueError: Se o arquivo for inválido
+        """
+        error = self._check_photo_file(file_path)
+        if error:
+            raise ValueError(error)
+        
+        processed_path = self._process_and_save_photo(file_path)
+        print(f"✅ Foto processada e salva: {processed_path}")
+        return processed_path
+    
+    def process_many(self, paths: List[str]) -> List[Optional[str]]:
+        """
+        Valida e processa várias fotos em paralelo (importação em lote)
+        
+        O Pillow libera o GIL ao decodificar, redimensionar e codificar, então
+        threads bastam para ocupar todos os núcleos. Nenhum diálogo é exibido:
+        os erros são apenas registrados.
+        
+        Args:
+            paths: Caminhos das fotos originais
+            
+        Returns:
+            List[Optional[str]]: Caminhos das fotos processadas, na mesma ordem (None se inválida)
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(self._process_photo_quietly, paths))
+    
+    def _process_photo_quietly(self, file_path: str) -> Optional[str]:
+        """Valida e processa uma foto sem diálogos (seguro fora da thread do Tk)"""
+        try:
+            return self.process_photo(file_path)
+        except Exception as e:
+            print(f"❌ Erro ao processar foto {os.path.basename(file_path)}: {e}")
+            return None
+    
     def _validate_photo_file(self, file_path: str) -> bool:
         """
         Valida se o arquivo de foto é válido
@@ -115,29 +404,10 @@ class PhotoHandler:
             bool: True se válido
         """
         try:
-            # Verificar se arquivo existe
-            if not os.path.exists(file_path):
-                messagebox.showerror("Erro", "Arquivo não encontrado")
-                return False
-            
-            # Verificar extensão
-            file_ext = os.path.splitext(file_path)[1].lower()
-            if file_ext not in self.supported_formats:
-                messagebox.showerror("Erro", f"Formato não suportado: {file_ext}")
-                return False
-            
-            # Verificar tamanho do arquivo
-            file_size = os.path.getsize(file_path)
-            if file_size > self.max_file_size:
-                messagebox.showerror("Erro", f"Arquivo muito grande: {file_size / (1024*1024):.1f}MB")
-                return False
-            
-            # Verificar se é uma imagem válida
-            try:
-                with Image.open(file_path) as img:
-                    img.verify()
-            except Exception:
-                messagebox.showerror("Erro", "Arquivo não é uma imagem válida")
+            error = self._check_photo_file(file_path)
+            if error:
+                from tkinter import messagebox
+                messagebox.showerror("Erro", error)
                 return False
             
             return True
@@ -146,7 +416,64 @@ class PhotoHandler:
             print(f"❌ Erro na validação: {e}")
             return False
     
-    def _process_and_save_photo(self, original_path: str) -> Optional[str]:
+    def _check_photo_file(self, file_path: str) -> Optional[str]:
+        """
+        Verificações baratas do arquivo de foto, sem abri-lo
+        
+        O conteúdo da imagem é validado ao ser decodificado em _open_image.
+        
+        Args:
+            file_path: Caminho do arquivo
+            
+        Returns:
+            str: Mensagem de erro ou None se válido
+        """
+        # Verificar extensão (sem I/O: rejeita antes de qualquer syscall)
+        file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext not in self._fmt_set:
+            return f"Formato não suportado: {file_ext}"
+        
+        # Existência e tamanho com um único stat
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
+            return "Arquivo não encontrado"
+        
+        # Verificar tamanho do arquivo
+        if file_size > self.max_file_size:
+            return f"Arquivo muito grande: {file_size / (1024*1024):.1f}MB"
+        
+        return None
+    
+    def _open_image(self, file_path: str, draft_size: Tuple[int, int]) -> Image.Image:
+        """
+        Abre e decodifica a imagem uma única vez
+        
+        A decodificação completa (load) também detecta arquivos inválidos ou
+        truncados, substituindo uma passada separada de verify().
+        
+        Args:
+            file_path: Caminho do arquivo
+            draft_size: Tamanho alvo para a decodificação reduzida de JPEGs
+            
+        Returns:
+            Image.Image: Imagem carregada
+            
+        Raises:
+            ValueError: Se o arquivo não for uma imagem válida
+        """
+        img = None
+        try:
+            img = Image.open(file_path)
+            _draft_jpeg(img, draft_size)
+            img.load()
+            return img
+        except Exception as e:
+            if img is not None:
+                img.close()
+            raise ValueError("Arquivo não é uma imagem válida") from e
+    
+    def _process_and_save_photo(self, original_path: str) -> str:
         """
         Processa e salva a foto
         
@@ -155,32 +482,39 @@ class PhotoHandler:
             
         Returns:
             str: Caminho da foto processada
+            
+        Raises:
+            ValueError: Se o arquivo não for uma imagem válida
         """
-        try:
-            # Abrir imagem
-            with Image.open(original_path) as img:
-                # Converter para RGB se necessário
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    img = img.convert('RGB')
-                
-                # Redimensionar se muito grande
-                if img.width > self.max_dimensions[0] or img.height > self.max_dimensions[1]:
-                    img.thumbnail(self.max_dimensions, Image.Resampling.LANCZOS)
-                
-                # Gerar nome único para o arquivo
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                original_name = os.path.splitext(os.path.basename(original_path))[0]
-                new_filename = f"{original_name}_{timestamp}.jpg"
-                new_path = os.path.join(self.photos_dir, new_filename)
-                
-                # Salvar como JPEG com qualidade otimizada
-                img.save(new_path, 'JPEG', quality=85, optimize=True)
-                
-                return new_path
-                
-        except Exception as e:
-            print(f"❌ Erro ao processar foto: {e}")
-            return None
+        # Abrir imagem (JPEGs grandes já decodificados na escala mais próxima do tamanho final)
+        with self._open_image(original_path, self.max_dimensions) as img:
+            # PNG/TIFF enormes: média de blocos antes de qualquer outra etapa
+            img = _box_reduce(img, self.max_dimensions)
+            
+            # Converter para RGB antes de redimensionar: o resize trabalha em 3 canais,
+            # não 4 (RGBA/CMYK), e o JPEG final não precisa de outra conversão.
+            # Tons de cinza (L) ficam em 1 canal, que o JPEG também aceita.
+            if img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            
+            # Redimensionar se muito grande
+            if img.width > self.max_dimensions[0] or img.height > self.max_dimensions[1]:
+                if img.mode in ('RGB', 'L') and _load_cv2() is not None:
+                    img = _resize_cv2(img, self.max_dimensions)
+                else:
+                    img.thumbnail(self.max_dimensions, RESAMPLE)
+            
+            # Gerar nome único para o arquivo
+            tag = f"{int(time.time())}_{next(_UID):x}"
+            original_name = os.path.splitext(os.path.basename(original_path))[0]
+            new_filename = f"{original_name}_{tag}.jpg"
+            new_path = os.path.join(self.photos_dir, new_filename)
+            
+            # Salvar como JPEG progressivo 4:2:0 (progressivo já gera tabelas de Huffman
+            # otimizadas, então a passada extra de optimize=True é dispensada)
+            img.save(new_path, 'JPEG', quality=85, optimize=False, progressive=True, subsampling=2)
+            
+            return new_path
     
     def create_thumbnail(self, photo_path: str, size: Tuple[int, int] = None) -> Optional[str]:
         """
@@ -198,8 +532,10 @@ class PhotoHandler:
                 size = self.thumbnail_size
             
             with Image.open(photo_path) as img:
+                _draft_jpeg(img, size)
+                
                 # Manter proporção
-                img.thumbnail(size, Image.Resampling.LANCZOS)
+                img.thumbnail(size, RESAMPLE)
                 
                 # Gerar nome do thumbnail
                 dir_path = os.path.dirname(photo_path)
@@ -228,11 +564,14 @@ class PhotoHandler:
             dict: Informações da foto
         """
         try:
-            if not os.path.exists(photo_path):
+            # Tamanho e datas com um único stat
+            try:
+                stat = os.stat(photo_path)
+            except FileNotFoundError:
                 return None
             
             with Image.open(photo_path) as img:
-                file_size = os.path.getsize(photo_path)
+                file_size = stat.st_size
                 
                 return {
                     'path': photo_path,
@@ -244,8 +583,8 @@ class PhotoHandler:
                     'height': img.height,
                     'format': img.format,
                     'mode': img.mode,
-                    'created_date': datetime.fromtimestamp(os.path.getctime(photo_path)).isoformat(),
-                    'modified_date': datetime.fromtimestamp(os.path.getmtime(photo_path)).isoformat()
+                    'created_date': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                    'modified_date': datetime.fromtimestamp(stat.st_mtime).isoformat()
                 }
                 
         except Exception as e:
@@ -263,17 +602,19 @@ class PhotoHandler:
             bool: True se deletada com sucesso
         """
         try:
-            if not os.path.exists(photo_path):
+            # Deletar arquivo principal (se for hardlink de uma cópia de inspeção,
+            # só a contagem de links diminui; a outra entrada continua válida)
+            try:
+                os.remove(photo_path)
+            except FileNotFoundError:
                 print(f"⚠️ Foto não encontrada: {photo_path}")
                 return False
             
-            # Deletar arquivo principal
-            os.remove(photo_path)
-            
             # Deletar thumbnail se existir
-            thumbnail_path = self._get_thumbnail_path(photo_path)
-            if os.path.exists(thumbnail_path):
-                os.remove(thumbnail_path)
+            try:
+                os.remove(self._get_thumbnail_path(photo_path))
+            except FileNotFoundError:
+                pass
             
             print(f"✅ Foto deletada: {photo_path}")
             return True
@@ -312,13 +653,25 @@ class PhotoHandler:
         try:
             # Criar pasta da inspeção
             inspection_dir = os.path.join(self.photos_dir, f"inspecao_{inspection_id}")
-            if not os.path.exists(inspection_dir):
-                os.makedirs(inspection_dir)
+            os.makedirs(inspection_dir, exist_ok=True)
             
-            # Copiar foto
             filename = os.path.basename(photo_path)
             new_path = os.path.join(inspection_dir, filename)
-            shutil.copy2(photo_path, new_path)
+            
+            # Fotos já processadas nunca são alteradas: um hardlink basta (zero bytes, zero I/O)
+            linked = False
+            if self._is_managed_photo(photo_path):
+                try:
+                    os.link(photo_path, new_path)
+                    linked = True
+                except OSError:
+                    # Outro dispositivo, FS sem suporte ou destino existente: copiar
+                    pass
+            
+            if not linked:
+                # Copiar foto (copyfile usa sendfile/copy_file_range no kernel; as fotos
+                # processadas não têm metadados a preservar, então não há copystat)
+                shutil.copyfile(photo_path, new_path)
             
             print(f"✅ Foto copiada para inspeção: {new_path}")
             return new_path
@@ -327,6 +680,15 @@ class PhotoHandler:
             print(f"❌ Erro ao copiar foto: {e}")
             return None
     
+    def _is_managed_photo(self, photo_path: str) -> bool:
+        """Verifica se a foto está dentro de photos_dir (já processada por este manipulador)"""
+        photos_dir = os.path.abspath(self.photos_dir)
+        try:
+            return os.path.commonpath([photos_dir, os.path.abspath(photo_path)]) == photos_dir
+        except ValueError:
+            # Drives diferentes no Windows
+            return False
+    
     def get_all_photos(self) -> List[str]:
         """
         Retorna todas as fotos armazenadas
@@ -336,10 +698,12 @@ class PhotoHandler:
         """
         try:
             photos = []
-            for root, dirs, files in os.walk(self.photos_dir):
-                for file in files:
-                    if any(file.lower().endswith(ext) for ext in self.supported_formats):
-                        photos.append(os.path.join(root, file))
+            with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+                pending = deque([executor.submit(self._scan_photos_dir, self.photos_dir)])
+                while pending:
+                    found, subdirs = pending.popleft().result()
+                    photos.extend(found)
+                    pending.extend(executor.submit(self._scan_photos_dir, subdir) for subdir in subdirs)
             
             return photos
             
@@ -347,6 +711,35 @@ class PhotoHandler:
             print(f"❌ Erro ao listar fotos: {e}")
             return []
     
+    def _scan_photos_dir(self, directory: str) -> Tuple[List[str], List[str]]:
+        """
+        Lista as fotos e os subdiretórios de um único diretório
+        
+        Usa o tipo já retornado pelo scandir, sem um stat extra por arquivo.
+        Diretórios ilegíveis são ignorados, como no os.walk. (Path.rglob foi
+        medido como alternativa e ficou ~7x mais lento: cria um Path por entrada.)
+        
+        Args:
+            directory: Diretório a listar
+            
+        Returns:
+            Tuple[List[str], List[str]]: (fotos, subdiretórios)
+        """
+        photos = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(self._fmt_tuple):
+                        photos.append(entry.path)
+        except OSError:
+            pass
+        
+        return photos, subdirs
+    
     def cleanup_orphaned_photos(self) -> int:
         """
         Remove fotos órfãs (sem referência no banco)
@@ -379,10 +772,16 @@ class PhotoPreview:
         self.current_photo = None
         self.photo_label = None
         
+        # PhotoImage reaproveitado entre previews de mesmo modo e tamanho
+        self._photo_image = None
+        self._photo_key = None
+        
         self._create_photo_label()
     
     def _create_photo_label(self):
         """Cria o label para exibir a foto"""
+        import tkinter as tk
+        
         self.photo_label = tk.Label(self.parent_widget, text="Nenhuma foto selecionada")
         self.photo_label.pack(pady=10)
     
@@ -394,28 +793,44 @@ class PhotoPreview:
             photo_path: Caminho da foto
         """
         try:
-            if not photo_path or not os.path.exists(photo_path):
+            if not photo_path:
                 self.clear_preview()
                 return
             
-            # Abrir e redimensionar imagem
-            with Image.open(photo_path) as img:
-                # Manter proporção
-                img.thumbnail(self.max_size, Image.Resampling.LANCZOS)
-                
-                # Converter para PhotoImage
-                photo = ImageTk.PhotoImage(img)
-                
-                # Atualizar label
-                self.photo_label.configure(image=photo, text="")
-                self.photo_label.image = photo  # Manter referência
-                
-                self.current_photo = photo_path
+            try:
+                # Miniatura do cache compartilhado (ou gerada e gravada nele)
+                img = load_thumbnail(photo_path, self.max_size)
+            except FileNotFoundError:
+                self.clear_preview()
+                return
+            photo = self._to_photo_image(img)
+            
+            # Atualizar label (a referência fica em self._photo_image)
+            self.photo_label.configure(image=photo, text="")
+            
+            self.current_photo = photo_path
                 
         except Exception as e:
             print(f"❌ Erro ao atualizar preview: {e}")
             self.photo_label.configure(text=f"Erro ao carregar foto: {e}")
     
+    def _to_photo_image(self, img: Image.Image) -> 'ImageTk.PhotoImage':
+        """
+        Converte para PhotoImage reaproveitando o objeto Tk anterior
+        
+        Com mesmo modo e tamanho (fotos da mesma câmera), paste sobrescreve os
+        pixels no lugar em vez de alocar uma nova imagem Tk a cada preview.
+        """
+        from PIL import ImageTk
+        
+        key = (img.mode, img.size)
+        if self._photo_image is not None and key == self._photo_key:
+            self._photo_image.paste(img)
+        else:
+            self._photo_image = ImageTk.PhotoImage(img)
+            self._photo_key = key
+        return self._photo_image
+    
     def clear_preview(self):
         """Limpa o preview"""
         self.photo_label.configure(image="", text="Nenhuma foto selecionada")
@@ -430,6 +845,19 @@ class PhotoPreview:
         """
         return self.current_photo
 
+# Instância única reaproveitada pelas funções de conveniência, sem repetir
+# a verificação do diretório de fotos a cada upload
+_DEFAULT_HANDLER: Optional[PhotoHandler] = None
+_DEFAULT_HANDLER_LOCK = threading.Lock()
+
+def _get_default_handler() -> PhotoHandler:
+    """Retorna o manipulador compartilhado, criando-o na primeira chamada"""
+    global _DEFAULT_HANDLER
+    with _DEFAULT_HANDLER_LOCK:
+        if _DEFAULT_HANDLER is None:
+            _DEFAULT_HANDLER = PhotoHandler()
+        return _DEFAULT_HANDLER
+
 # Funções de conveniência para compatibilidade com o React
 def handle_photo_upload(photo_path: str) -> Optional[str]:
     """
@@ -441,8 +869,7 @@ def handle_photo_upload(photo_path: str) -> Optional[str]:
     Returns:
         str: Caminho da foto processada ou None
     """
-    handler = PhotoHandler()
-    return handler.validate_and_process_photo(photo_path)
+    return _get_default_handler().validate_and_process_photo(photo_path)
 
 def create_photo_preview(parent_widget, max_size: Tuple[int, int] = (300, 300)) -> PhotoPreview:
     """
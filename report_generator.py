@@ -5,8 +5,14 @@ Substitui o gerarPdfInspecao do React
 """
 
 import os
+import io
+import sys
+import functools
+import itertools
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple
 from reportlab.lib.pagesizes import A4, letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, cm
@@ -15,79 +21,257 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.platypus.flowables import Flowable
 from reportlab.pdfgen import canvas
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from PIL import Image as PILImage
+
+from date_validator import DateValidator
+
+# Sequência do processo para nomes únicos com vários relatórios no mesmo segundo
+# (next() em itertools.count é atômico, seguro nas threads do lote)
+_REPORT_SEQ = itertools.count()
+
+# Tamanho da foto no PDF e resolução usada para pré-reduzi-la antes de embutir
+_PHOTO_SIZE = (6*cm, 4*cm)
+_PHOTO_DPI = 150
+
+# Cores das tabelas resolvidas uma única vez
+_GREY = colors.grey
+_WHITE = colors.whitesmoke
+_BEIGE = colors.beige
+_BLACK = colors.black
+
+def _table_style(header_font_size: int) -> TableStyle:
+    """Estilo padrão das tabelas: cabeçalho cinza, corpo bege e grade preta"""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), _GREY),
+        ('TEXTCOLOR', (0, 0), (-1, 0), _WHITE),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), _BEIGE),
+        ('GRID', (0, 0), (-1, -1), 1, _BLACK)
+    ])
+
+# Estilo de tabela criado uma única vez (setStyle copia os comandos para cada tabela)
+_TABLE_STYLE_2COL = _table_style(10)
+
+# Geometria da grade do resumo (mesma aparência do estilo padrão das tabelas)
+_GRID_HEADER_HEIGHT = 24
+_GRID_ROW_HEIGHT = 18
+_GRID_PADDING = 6
+
+class _SummaryGrid(Flowable):
+    """
+    Grade do resumo desenhada direto no canvas
+    
+    Colunas com larguras fixas e células de texto simples: não há o que o Table
+    calcular, então cada célula vira um drawString. Divide-se por linhas entre
+    páginas, repetindo o cabeçalho.
+    """
+    
+    def __init__(self, header: List[str], rows: List[List[str]], col_widths: List[float]):
+        super().__init__()
+        self.header = header
+        self.rows = rows
+        self.col_widths = col_widths
+        self.hAlign = 'CENTER'  # Como o Table
+        self.width = sum(col_widths)
+        self.height = _GRID_HEADER_HEIGHT + len(rows) * _GRID_ROW_HEIGHT
+    
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+    
+    def split(self, availWidth, availHeight):
+        fit = int((availHeight - _GRID_HEADER_HEIGHT) // _GRID_ROW_HEIGHT)
+        if fit < 1:
+            return []
+        return [_SummaryGrid(self.header, self.rows[:fit], self.col_widths),
+                _SummaryGrid(self.header, self.rows[fit:], self.col_widths)]
+    
+    def draw(self):
+        c = self.canv
+        body_height = self.height - _GRID_HEADER_HEIGHT
+        xs = [0]
+        for width in self.col_widths:
+            xs.append(xs[-1] + width)
+        
+        # Fundos: cabeçalho cinza e corpo bege
+        c.setFillColor(_GREY)
+        c.rect(0, body_height, self.width, _GRID_HEADER_HEIGHT, stroke=0, fill=1)
+        c.setFillColor(_BEIGE)
+        c.rect(0, 0, self.width, body_height, stroke=0, fill=1)
+        
+        # Cabeçalho
+        c.setFillColor(_WHITE)
+        c.setFont('Helvetica-Bold', 8)
+        baseline = self.height - 3 - 8
+        for x, text in zip(xs, self.header):
+            c.drawString(x + _GRID_PADDING, baseline, text)
+        
+        # Linhas
+        c.setFillColor(_BLACK)
+        c.setFont('Helvetica', 10)
+        baseline = body_height - 3 - 10
+        for row in self.rows:
+            for x, text in zip(xs, row):
+                c.drawString(x + _GRID_PADDING, baseline, str(text))
+            baseline -= _GRID_ROW_HEIGHT
+        
+        # Grade
+        c.setStrokeColor(_BLACK)
+        c.setLineWidth(1)
+        for x in xs:
+            c.line(x, 0, x, self.height)
+        c.line(0, self.height, self.width, self.height)
+        y = body_height
+        while y >= 0:
+            c.line(0, y, self.width, y)
+            y -= _GRID_ROW_HEIGHT
+
+def _photo_mtime(photo_path: Optional[str]) -> Optional[float]:
+    """Data de modificação da foto, ou None se não informada ou inexistente"""
+    if not photo_path:
+        return None
+    try:
+        return os.stat(photo_path).st_mtime
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=128)
+def _load_photo_bytes(photo_path: str, mtime: float) -> bytes:
+    """
+    JPEG da foto já reduzido ao tamanho do PDF, em cache por (caminho, mtime)
+    
+    Fotos repetidas em um lote são decodificadas uma única vez, e o stream
+    embutido em cada PDF fica muito menor que a foto original.
+    """
+    size_px = tuple(round(points / inch * _PHOTO_DPI) for points in _PHOTO_SIZE)
+    with PILImage.open(photo_path) as img:
+        img.draft('RGB', size_px)
+        img.thumbnail(size_px, PILImage.Resampling.LANCZOS)
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        buffer = io.BytesIO()
+        img.save(buffer, 'JPEG', quality=85)
+        return buffer.getvalue()
 
 class InspectionReportGenerator:
     """Classe para gerar relatórios de inspeção em PDF"""
     
-    def __init__(self, output_dir: str = 'relatorios'):
+    # Linhas das tabelas: (rótulo, chave nos dados)
+    _BASIC_ROWS = (
+        ('Plataforma', 'plataforma'),
+        ('Módulo', 'modulo'),
+        ('Setor', 'setor'),
+        ('Tipo de Equipamento', 'tipoEquipamento'),
+        ('TAG', 'tag')
+    )
+    
+    _DETAIL_ROWS = (
+        ('Data da Última Inspeção', 'ultima'),
+        ('Data da Inspeção Atual', 'data'),
+        ('Tipo de Dano', 'tipoDano'),
+        ('Defeito Identificado', 'defeito'),
+        ('Causa do Defeito', 'causa'),
+        ('Categoria RTI', 'categoriaRTI'),
+        ('Recomendação', 'recomendacao')
+    )
+    
+    # Colunas do resumo (a coluna Status é calculada a partir da última)
+    _SUMMARY_COLUMNS = (
+        ('TAG', 'tag'),
+        ('Tipo', 'tipoEquipamento'),
+        ('Plataforma', 'plataforma'),
+        ('Última Inspeção', 'ultima')
+    )
+    
+    # Estilos de parágrafo compartilhados por todas as instâncias (criados na importação)
+    styles = getSampleStyleSheet()
+    
+    # Título principal
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        textColor=colors.darkblue
+    )
+    
+    # Subtítulos
+    subtitle_style = ParagraphStyle(
+        'CustomSubtitle',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=20,
+        spaceBefore=20,
+        textColor=colors.darkgreen
+    )
+    
+    # Cabeçalhos de seção
+    section_style = ParagraphStyle(
+        'CustomSection',
+        parent=styles['Heading3'],
+        fontSize=12,
+        spaceAfter=15,
+        spaceBefore=15,
+        textColor=colors.black
+    )
+    
+    # Texto normal
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6
+    )
+    
+    # Texto pequeno
+    small_style = ParagraphStyle(
+        'CustomSmall',
+        parent=styles['Normal'],
+        fontSize=8,
+        spaceAfter=4
+    )
+    
+    def __init__(self, output_dir: str = 'relatorios', use_threads: bool = False, compress: bool = True):
         """
         Inicializa o gerador de relatórios
         
         Args:
             output_dir: Diretório para salvar os relatórios
+            use_threads: Gerar lotes com threads em vez de processos (lotes dominados
+                por leitura de fotos grandes, ou onde criar processos é caro);
+                executáveis congelados sempre usam threads
+            compress: Comprimir (zlib) o conteúdo das páginas. False gera PDFs várias
+                vezes maiores, porém mais rápido; útil em lotes de rascunho/uso interno
         """
         self.output_dir = output_dir
-        self.styles = getSampleStyleSheet()
+        self.compress = compress
+        self._output_prefix = os.path.join(output_dir, '')  # Diretório + separador, montado uma vez
+        self.use_threads = use_threads
         self._ensure_output_directory()
-        self._setup_custom_styles()
     
     def _ensure_output_directory(self):
         """Garante que o diretório de saída existe"""
         try:
-            if not os.path.exists(self.output_dir):
-                os.makedirs(self.output_dir)
-                print(f"✅ Diretório de relatórios criado: {self.output_dir}")
+            # Um único mkdir: criado agora ou já existente
+            os.makedirs(self.output_dir)
+            print(f"✅ Diretório de relatórios criado: {self.output_dir}")
+        except FileExistsError:
+            pass
         except Exception as e:
             print(f"❌ Erro ao criar diretório de relatórios: {e}")
             raise
-    
-    def _setup_custom_styles(self):
-        """Configura estilos personalizados para o relatório"""
-        # Título principal
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=18,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        )
-        
-        # Subtítulos
-        self.subtitle_style = ParagraphStyle(
-            'CustomSubtitle',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            spaceAfter=20,
-            spaceBefore=20,
-            textColor=colors.darkgreen
-        )
-        
-        # Cabeçalhos de seção
-        self.section_style = ParagraphStyle(
-            'CustomSection',
-            parent=self.styles['Heading3'],
-            fontSize=12,
-            spaceAfter=15,
-            spaceBefore=15,
-            textColor=colors.black
-        )
-        
-        # Texto normal
-        self.normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=6
-        )
-        
-        # Texto pequeno
-        self.small_style = ParagraphStyle(
-            'CustomSmall',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            spaceAfter=4
-        )
+        
+        # Falhar já na criação, não depois de montar um lote inteiro de relatórios
+        try:
+            with tempfile.TemporaryFile(dir=self.output_dir):
+                pass
+        except OSError as e:
+            message = f"Não é possível gravar no diretório de relatórios {self.output_dir}: {e}"
+            print(f"❌ {message}")
+            raise PermissionError(message) from e
     
     def generate_inspection_report(self, inspection_data: Dict[str, Any], 
                                  photo_path: Optional[str] = None) -> str:
@@ -102,45 +286,14 @@ class InspectionReportGenerator:
             str: Caminho do arquivo PDF gerado
         """
         try:
-            # Gerar nome do arquivo
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # Gerar nome do arquivo (o mesmo instante vai para o rodapé)
+            now = datetime.now()
             equipment_tag = inspection_data.get('tag', 'UNKNOWN')
-            filename = f"relatorio_inspecao_{equipment_tag}_{timestamp}.pdf"
-            filepath = os.path.join(self.output_dir, filename)
-            
-            # Criar documento
-            doc = SimpleDocTemplate(filepath, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm,
-                                 topMargin=2*cm, bottomMargin=2*cm)
-            
-            # Conteúdo do relatório
-            story = []
-            
-            # Título
-            story.append(Paragraph("RELATÓRIO DE INSPEÇÃO DE EQUIPAMENTO", self.title_style))
-            story.append(Spacer(1, 20))
-            
-            # Informações básicas
-            story.extend(self._create_basic_info_section(inspection_data))
-            story.append(Spacer(1, 20))
-            
-            # Detalhes da inspeção
-            story.extend(self._create_inspection_details_section(inspection_data))
-            story.append(Spacer(1, 20))
-            
-            # Foto (se fornecida)
-            if photo_path and os.path.exists(photo_path):
-                story.extend(self._create_photo_section(photo_path))
-                story.append(Spacer(1, 20))
-            
-            # Status e recomendações
-            story.extend(self._create_status_section(inspection_data))
-            story.append(Spacer(1, 20))
-            
-            # Rodapé
-            story.extend(self._create_footer_section())
+            filename = f"relatorio_inspecao_{equipment_tag}_{self._file_suffix(now)}.pdf"
+            filepath = self._output_prefix + filename
             
             # Construir PDF
-            doc.build(story)
+            self._build_pdf(filepath, self._story_for(inspection_data, photo_path, now))
             
             print(f"✅ Relatório gerado: {filepath}")
             return filepath
@@ -149,6 +302,77 @@ class InspectionReportGenerator:
             print(f"❌ Erro ao gerar relatório: {e}")
             raise
     
+    def _file_suffix(self, now: datetime) -> str:
+        """
+        Sufixo único dos nomes de arquivo: data/hora + processo + sequência
+        
+        Evita que dois relatórios gerados no mesmo segundo (mesma TAG, lote em
+        threads ou processos) se sobrescrevam.
+        """
+        return f"{now.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{next(_REPORT_SEQ)}"
+    
+    def _create_document(self, target) -> SimpleDocTemplate:
+        """Cria o documento A4 com as margens padrão dos relatórios (target: caminho ou arquivo)"""
+        return SimpleDocTemplate(target, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm,
+                                 topMargin=2*cm, bottomMargin=2*cm,
+                                 pageCompression=1 if self.compress else 0)
+    
+    def _build_pdf(self, filepath: str, story: List[Flowable]):
+        """
+        Gera o PDF em memória e grava o arquivo de uma só vez
+        
+        O ReportLab escreve o documento em muitos pedaços pequenos; em memória eles
+        viram uma única escrita, o que pesa em pastas de rede (SMB/NFS).
+        """
+        buffer = io.BytesIO()
+        self._create_document(buffer).build(story)
+        with open(filepath, 'wb') as f:
+            f.write(buffer.getbuffer())
+    
+    def _story_for(self, inspection_data: Dict[str, Any], photo_path: Optional[str] = None,
+                   now: Optional[datetime] = None) -> List[Flowable]:
+        """
+        Monta o conteúdo do relatório de uma inspeção
+        
+        Args:
+            inspection_data: Dados da inspeção
+            photo_path: Caminho da foto (opcional)
+            now: Data/hora de geração exibida no rodapé (padrão: agora)
+            
+        Returns:
+            List[Flowable]: Elementos do relatório
+        """
+        story = []
+        
+        # Título
+        story.append(Paragraph("RELATÓRIO DE INSPEÇÃO DE EQUIPAMENTO", self.title_style))
+        story.append(Spacer(1, 20))
+        
+        # Informações básicas
+        story.extend(self._create_basic_info_section(inspection_data))
+        story.append(Spacer(1, 20))
+        
+        # Detalhes da inspeção
+        story.extend(self._create_inspection_details_section(inspection_data))
+        story.append(Spacer(1, 20))
+        
+        # Foto (se fornecida e existente; um único stat também fornece a chave do cache)
+        photo_mtime = _photo_mtime(photo_path)
+        if photo_mtime is not None:
+            story.extend(self._create_photo_section(photo_path, photo_mtime))
+            story.append(Spacer(1, 20))
+        
+        # Status e recomendações (apenas com data da última inspeção)
+        status_section = self._create_status_section(inspection_data)
+        if status_section:
+            story.extend(status_section)
+            story.append(Spacer(1, 20))
+        
+        # Rodapé
+        story.extend(self._create_footer_section(now))
+        
+        return story
+    
     def _create_basic_info_section(self, data: Dict[str, Any]) -> List[Flowable]:
         """Cria seção de informações básicas"""
         elements = []
@@ -156,26 +380,10 @@ class InspectionReportGenerator:
         elements.append(Paragraph("INFORMAÇÕES BÁSICAS", self.subtitle_style))
         
         # Tabela de informações
-        basic_info = [
-            ['Campo', 'Valor'],
-            ['Plataforma', data.get('plataforma', 'N/A')],
-            ['Módulo', data.get('modulo', 'N/A')],
-            ['Setor', data.get('setor', 'N/A')],
-            ['Tipo de Equipamento', data.get('tipoEquipamento', 'N/A')],
-            ['TAG', data.get('tag', 'N/A')]
-        ]
+        basic_info = [['Campo', 'Valor']] + [[label, data.get(key, 'N/A')] for label, key in self._BASIC_ROWS]
         
         table = Table(basic_info, colWidths=[3*cm, 8*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(_TABLE_STYLE_2COL)
         
         elements.append(table)
         return elements
@@ -187,28 +395,10 @@ class InspectionReportGenerator:
         elements.append(Paragraph("DETALHES DA INSPEÇÃO", self.subtitle_style))
         
         # Tabela de detalhes
-        inspection_details = [
-            ['Campo', 'Valor'],
-            ['Data da Última Inspeção', data.get('ultima', 'N/A')],
-            ['Data da Inspeção Atual', data.get('data', 'N/A')],
-            ['Tipo de Dano', data.get('tipoDano', 'N/A')],
-            ['Defeito Identificado', data.get('defeito', 'N/A')],
-            ['Causa do Defeito', data.get('causa', 'N/A')],
-            ['Categoria RTI', data.get('categoriaRTI', 'N/A')],
-            ['Recomendação', data.get('recomendacao', 'N/A')]
-        ]
+        inspection_details = [['Campo', 'Valor']] + [[label, data.get(key, 'N/A')] for label, key in self._DETAIL_ROWS]
         
         table = Table(inspection_details, colWidths=[4*cm, 7*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(_TABLE_STYLE_2COL)
         
         elements.append(table)
         
@@ -220,15 +410,16 @@ class InspectionReportGenerator:
         
         return elements
     
-    def _create_photo_section(self, photo_path: str) -> List[Flowable]:
-        """Cria seção da foto"""
+    def _create_photo_section(self, photo_path: str, photo_mtime: float) -> List[Flowable]:
+        """Cria seção da foto (photo_mtime: data de modificação, chave do cache da imagem)"""
         elements = []
         
         elements.append(Paragraph("FOTO DA INSPEÇÃO", self.subtitle_style))
         
         try:
-            # Redimensionar imagem para o PDF
-            img = Image(photo_path, width=6*cm, height=4*cm)
+            # Redimensionar imagem para o PDF (cada geração usa seu próprio buffer)
+            photo_bytes = _load_photo_bytes(photo_path, photo_mtime)
+            img = Image(io.BytesIO(photo_bytes), width=_PHOTO_SIZE[0], height=_PHOTO_SIZE[1])
             elements.append(img)
             
             # Informações da foto
@@ -241,58 +432,86 @@ class InspectionReportGenerator:
         return elements
     
     def _create_status_section(self, data: Dict[str, Any]) -> List[Flowable]:
-        """Cria seção de status e recomendações"""
+        """Cria seção de status e recomendações (vazia sem data da última inspeção)"""
+        last_inspection = data.get('ultima', '')
+        if not last_inspection:
+            return []
+        
         elements = []
         
         elements.append(Paragraph("STATUS E RECOMENDAÇÕES", self.subtitle_style))
         
         # Calcular status da inspeção
-        from date_validator import DateValidator
+        status_info = DateValidator.get_inspection_status(last_inspection, 12)
+        
+        # Tabela de status
+        status_data = [
+            ['Status', 'Descrição'],
+            ['Última Inspeção', status_info.get('last_inspection_formatted', 'N/A')],
+            ['Próxima Inspeção', status_info.get('next_inspection_formatted', 'N/A')],
+            ['Dias até Vencimento', str(status_info.get('days_until_due', 'N/A'))],
+            ['Mensagem', status_info.get('message', 'N/A')]
+        ]
         
-        last_inspection = data.get('ultima', '')
-        if last_inspection:
-            status_info = DateValidator.get_inspection_status(last_inspection, 12)
-            
-            # Tabela de status
-            status_data = [
-                ['Status', 'Descrição'],
-                ['Última Inspeção', status_info.get('last_inspection_formatted', 'N/A')],
-                ['Próxima Inspeção', status_info.get('next_inspection_formatted', 'N/A')],
-                ['Dias até Vencimento', str(status_info.get('days_until_due', 'N/A'))],
-                ['Mensagem', status_info.get('message', 'N/A')]
-            ]
-            
-            table = Table(status_data, colWidths=[4*cm, 7*cm])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            elements.append(table)
+        table = Table(status_data, colWidths=[4*cm, 7*cm])
+        table.setStyle(_TABLE_STYLE_2COL)
+        
+        elements.append(table)
         
         return elements
     
-    def _create_footer_section(self) -> List[Flowable]:
-        """Cria seção do rodapé"""
+    def _create_footer_section(self, now: Optional[datetime] = None) -> List[Flowable]:
+        """Cria seção do rodapé (now: data/hora de geração; padrão: agora)"""
         elements = []
         
         elements.append(Spacer(1, 30))
         elements.append(Paragraph("_" * 50, self.normal_style))
         
         # Informações de geração
-        generation_info = f"Relatório gerado em: {datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}"
+        generation_info = f"Relatório gerado em: {(now or datetime.now()).strftime('%d/%m/%Y às %H:%M:%S')}"
         elements.append(Paragraph(generation_info, self.small_style))
         
         elements.append(Paragraph("Sistema de Inspeção de Equipamentos", self.small_style))
         
         return elements
     
+    def start_batch_reports(self, inspections: Iterable[Dict[str, Any]],
+                            max_workers: Optional[int] = None) -> 'BatchReportJob':
+        """
+        Inicia a geração em lote sem esperar os relatórios
+        
+        Relatórios independentes: um worker por núcleo. Em processos o doc.build
+        (layout, fontes, zlib) não disputa o GIL; cada processo cria seu gerador uma vez.
+        No máximo 2 relatórios por worker ficam submetidos; as próximas inspeções
+        só são lidas do iterador à medida que os anteriores são coletados.
+        
+        Com processos, o programa que chama precisa proteger o ponto de entrada com
+        if __name__ == '__main__' (spawn reimporta o módulo principal em cada worker).
+        Em executáveis congelados (PyInstaller, sys.frozen) são usadas threads, pois
+        os workers reexecutariam o programa inteiro sem multiprocessing.freeze_support().
+        
+        Args:
+            inspections: Inspeções (lista ou iterador)
+            max_workers: Número de workers (padrão: um por núcleo)
+            
+        Returns:
+            BatchReportJob: Lote em andamento, acompanhado por poll()
+        """
+        max_workers = max_workers or os.cpu_count()
+        if self.use_threads or getattr(sys, 'frozen', False):
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            render = self.generate_inspection_report
+        else:
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_report_worker,
+                                           initargs=(self.output_dir, self.compress))
+            render = _render_one
+        
+        try:
+            return BatchReportJob(executor, render, inspections, max_in_flight=2 * max_workers)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    
     def generate_batch_reports(self, inspections: List[Dict[str, Any]]) -> List[str]:
         """
         Gera relatórios em lote para múltiplas inspeções
@@ -303,32 +522,65 @@ class InspectionReportGenerator:
         Returns:
             List[str]: Lista de caminhos dos PDFs gerados
         """
-        generated_files = []
+        job = None
         
         try:
-            print(f"🔄 Gerando {len(inspections)} relatórios em lote...")
+            total = len(inspections)
+            print(f"🔄 Gerando {total} relatórios em lote...")
+            
+            job = self.start_batch_reports(inspections)
+            try:
+                while not job.finished:
+                    for i, pdf_path, error in job.poll(timeout=None):
+                        if error is None:
+                            print(f"✅ Relatório {job.done}/{total} gerado: {os.path.basename(pdf_path)}")
+                        else:
+                            print(f"❌ Erro ao gerar relatório {i}: {error}")
+            finally:
+                if not job.finished:
+                    job.cancel()
+            
+            print(f"🎉 Geração em lote concluída: {len(job.generated)}/{total} relatórios")
             
-            for i, inspection in enumerate(inspections, 1):
-                try:
-                    # Buscar foto se existir
-                    photo_path = inspection.get('foto_path')
-                    
-                    # Gerar relatório
-                    pdf_path = self.generate_inspection_report(inspection, photo_path)
-                    generated_files.append(pdf_path)
-                    
-                    print(f"✅ Relatório {i}/{len(inspections)} gerado: {os.path.basename(pdf_path)}")
-                    
-                except Exception as e:
-                    print(f"❌ Erro ao gerar relatório {i}: {e}")
-                    continue
+        except Exception as e:
+            print(f"❌ Erro na geração em lote: {e}")
             
-            print(f"🎉 Geração em lote concluída: {len(generated_files)}/{len(inspections)} relatórios")
-            return generated_files
+        # Mesma ordem das inspeções de entrada
+        return job.paths() if job is not None else []
+    
+    def generate_batch_reports_combined(self, inspections: List[Dict[str, Any]], combined_path: str) -> str:
+        """
+        Gera um único PDF com os relatórios de várias inspeções, um após o outro
+        
+        Alternativa a generate_batch_reports para exportação/arquivo: o documento
+        é criado uma vez e o layout do ReportLab roda em uma única passada.
+        
+        Args:
+            inspections: Lista de inspeções
+            combined_path: Caminho do PDF combinado
+            
+        Returns:
+            str: Caminho do PDF gerado
+        """
+        try:
+            print(f"🔄 Gerando PDF combinado com {len(inspections)} relatórios...")
+            
+            # Cada inspeção começa em uma nova página
+            now = datetime.now()
+            story = []
+            for i, inspection in enumerate(inspections):
+                if i:
+                    story.append(PageBreak())
+                story.extend(self._story_for(inspection, inspection.get('foto_path'), now))
+            
+            self._build_pdf(combined_path, story)
+            
+            print(f"✅ PDF combinado gerado: {combined_path}")
+            return combined_path
             
         except Exception as e:
-            print(f"❌ Erro na geração em lote: {e}")
-            return generated_files
+            print(f"❌ Erro ao gerar PDF combinado: {e}")
+            raise
     
     def generate_summary_report(self, inspections: List[Dict[str, Any]]) -> str:
         """
@@ -341,14 +593,10 @@ class InspectionReportGenerator:
             str: Caminho do PDF resumo
         """
         try:
-            # Gerar nome do arquivo
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"relatorio_resumo_inspecoes_{timestamp}.pdf"
-            filepath = os.path.join(self.output_dir, filename)
-            
-            # Criar documento
-            doc = SimpleDocTemplate(filepath, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm,
-                                 topMargin=2*cm, bottomMargin=2*cm)
+            # Gerar nome do arquivo (o mesmo instante vai para o rodapé)
+            now = datetime.now()
+            filename = f"relatorio_resumo_inspecoes_{self._file_suffix(now)}.pdf"
+            filepath = self._output_prefix + filename
             
             # Conteúdo do resumo
             story = []
@@ -357,19 +605,22 @@ class InspectionReportGenerator:
             story.append(Paragraph("RELATÓRIO RESUMO DE INSPEÇÕES", self.title_style))
             story.append(Spacer(1, 20))
             
+            # Status de cada inspeção calculado uma única vez para as duas seções
+            inspection_statuses = self._precompute_status(inspections)
+            
             # Estatísticas gerais
-            story.extend(self._create_summary_statistics(inspections))
+            story.extend(self._create_summary_statistics(inspection_statuses))
             story.append(Spacer(1, 20))
             
             # Tabela resumo
-            story.extend(self._create_summary_table(inspections))
+            story.extend(self._create_summary_table(inspection_statuses))
             story.append(Spacer(1, 20))
             
             # Rodapé
-            story.extend(self._create_footer_section())
+            story.extend(self._create_footer_section(now))
             
             # Construir PDF
-            doc.build(story)
+            self._build_pdf(filepath, story)
             
             print(f"✅ Relatório resumo gerado: {filepath}")
             return filepath
@@ -378,33 +629,28 @@ class InspectionReportGenerator:
             print(f"❌ Erro ao gerar relatório resumo: {e}")
             raise
     
-    def _create_summary_statistics(self, inspections: List[Dict[str, Any]]) -> List[Flowable]:
+    def _precompute_status(self, inspections: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], dict]]:
+        """
+        Calcula o status de todas as inspeções em uma única passada
+        
+        Args:
+            inspections: Lista de inspeções
+            
+        Returns:
+            List[Tuple[Dict, dict]]: Pares (inspeção, status), na mesma ordem
+        """
+        statuses = DateValidator.bulk_status([inspection.get('ultima', '') for inspection in inspections], 12)
+        return list(zip(inspections, statuses))
+    
+    def _create_summary_statistics(self, inspection_statuses: List[Tuple[Dict[str, Any], dict]]) -> List[Flowable]:
         """Cria estatísticas do resumo"""
         elements = []
         
         elements.append(Paragraph("ESTATÍSTICAS GERAIS", self.subtitle_style))
         
-        # Calcular estatísticas
-        total_inspections = len(inspections)
-        equipment_types = {}
-        platforms = {}
-        overdue_count = 0
-        
-        from date_validator import DateValidator
-        
-        for inspection in inspections:
-            # Contar tipos de equipamento
-            eq_type = inspection.get('tipoEquipamento', 'N/A')
-            equipment_types[eq_type] = equipment_types.get(eq_type, 0) + 1
-            
-            # Contar plataformas
-            platform = inspection.get('plataforma', 'N/A')
-            platforms[platform] = platforms.get(platform, 0) + 1
-            
-            # Contar vencidas
-            last_inspection = inspection.get('ultima', '')
-            if last_inspection and DateValidator.is_overdue(last_inspection, 12):
-                overdue_count += 1
+        # Calcular estatísticas (status já calculado em _precompute_status)
+        total_inspections = len(inspection_statuses)
+        overdue_count = sum(status_info['is_overdue'] for _, status_info in inspection_statuses)
         
         # Criar tabela de estatísticas
         stats_data = [
@@ -415,62 +661,138 @@ class InspectionReportGenerator:
         ]
         
         table = Table(stats_data, colWidths=[4*cm, 7*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(_TABLE_STYLE_2COL)
         
         elements.append(table)
         return elements
     
-    def _create_summary_table(self, inspections: List[Dict[str, Any]]) -> List[Flowable]:
+    def _create_summary_table(self, inspection_statuses: List[Tuple[Dict[str, Any], dict]]) -> List[Flowable]:
         """Cria tabela resumo das inspeções"""
         elements = []
         
         elements.append(Paragraph("RESUMO DAS INSPEÇÕES", self.subtitle_style))
         
         # Preparar dados da tabela
-        table_data = [['TAG', 'Tipo', 'Plataforma', 'Última Inspeção', 'Status']]
-        
-        from date_validator import DateValidator
+        keys = [key for _, key in self._SUMMARY_COLUMNS]
+        table_data = []
         
-        for inspection in inspections:
-            tag = inspection.get('tag', 'N/A')
-            eq_type = inspection.get('tipoEquipamento', 'N/A')
-            platform = inspection.get('plataforma', 'N/A')
-            last_inspection = inspection.get('ultima', 'N/A')
+        for inspection, status_info in inspection_statuses:
+            row = [inspection.get(key, 'N/A') for key in keys]
             
-            # Determinar status
-            if last_inspection != 'N/A':
-                status_info = DateValidator.get_inspection_status(last_inspection, 12)
-                status = status_info.get('message', 'N/A')
-            else:
-                status = 'N/A'
-            
-            table_data.append([tag, eq_type, platform, last_inspection, status])
-        
-        # Criar tabela
-        table = Table(table_data, colWidths=[2*cm, 3*cm, 2*cm, 3*cm, 4*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+            # Determinar status (só com a data da última inspeção, a última coluna)
+            row.append(status_info.get('message', 'N/A') if row[-1] != 'N/A' else 'N/A')
+            table_data.append(row)
         
-        elements.append(table)
+        # Criar tabela (desenhada direto no canvas; cabeçalho repetido em cada página)
+        header = [label for label, _ in self._SUMMARY_COLUMNS] + ['Status']
+        elements.append(_SummaryGrid(header, table_data, [2*cm, 3*cm, 2*cm, 3*cm, 4*cm]))
         return elements
 
+# Gerador de relatórios de cada processo do pool (criado uma vez por processo)
+_worker_report_generator = None
+
+def _init_report_worker(output_dir: str = 'relatorios', compress: bool = True):
+    """Cria o gerador de relatórios do processo (estilos e fontes carregados uma única vez)"""
+    global _worker_report_generator
+    _worker_report_generator = InspectionReportGenerator(output_dir, compress=compress)
+
+def _render_one(inspection: Dict[str, Any], photo_path: Optional[str]) -> str:
+    """Gera o PDF de uma inspeção em um processo do pool"""
+    return _worker_report_generator.generate_inspection_report(inspection, photo_path)
+
+class BatchReportJob:
+    """
+    Geração de relatórios em lote em andamento
+    
+    Criada por InspectionReportGenerator.start_batch_reports. poll() coleta os
+    relatórios concluídos sem bloquear (adequado a um root.after do Tk) e
+    cancel() descarta os que ainda não começaram.
+    """
+    
+    def __init__(self, executor: Executor, render: Callable[[Dict[str, Any], Optional[str]], str],
+                 inspections: Iterable[Dict[str, Any]], max_in_flight: int):
+        """
+        Submete as primeiras inspeções ao pool
+        
+        Args:
+            executor: Pool que gera os relatórios (encerrado ao fim do lote)
+            render: Função que gera o PDF de uma inspeção
+            inspections: Inspeções (lista ou iterador, consumido aos poucos)
+            max_in_flight: Máximo de relatórios submetidos e ainda não coletados
+        """
+        self._executor = executor
+        self._render = render
+        self._source = inspections
+        self._inspections = enumerate(inspections, 1)
+        self._max_in_flight = max_in_flight
+        self._pending = {}
+        self.submitted = 0
+        self.done = 0
+        self.generated: Dict[int, str] = {}
+        self.errors: List[Tuple[int, Exception]] = []
+        self.cancelled = False
+        self._submit_more()
+    
+    def _submit_more(self):
+        """Repõe a fila até max_in_flight, lendo as próximas inspeções do iterador"""
+        for i, inspection in itertools.islice(self._inspections, self._max_in_flight - len(self._pending)):
+            future = self._executor.submit(self._render, inspection, inspection.get('foto_path'))
+            self._pending[future] = i
+            self.submitted += 1
+        
+        if not self._pending:
+            self._executor.shutdown()
+    
+    @property
+    def finished(self) -> bool:
+        """True quando não há mais relatórios a coletar (concluído ou cancelado)"""
+        return not self._pending
+    
+    def poll(self, timeout: Optional[float] = 0) -> List[Tuple[int, Optional[str], Optional[Exception]]]:
+        """
+        Coleta os relatórios concluídos desde a última chamada
+        
+        Args:
+            timeout: Espera máxima pelo próximo relatório (0 = não bloqueia, None = sem limite)
+            
+        Returns:
+            List[Tuple[int, Optional[str], Optional[Exception]]]: (posição da inspeção,
+            caminho do PDF, erro) de cada relatório concluído
+        """
+        if not self._pending:
+            return []
+        
+        completed, _ = wait(self._pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        results = []
+        for future in completed:
+            i = self._pending.pop(future)
+            self.done += 1
+            try:
+                pdf_path = future.result()
+                self.generated[i] = pdf_path
+                results.append((i, pdf_path, None))
+            except Exception as e:
+                self.errors.append((i, e))
+                results.append((i, None, e))
+        
+        self._submit_more()
+        return results
+    
+    def cancel(self):
+        """Descarta os relatórios que ainda não começaram e libera o pool sem esperar os em andamento"""
+        self.cancelled = True
+        self._pending.clear()
+        self._inspections = iter(())
+        # Gerador do banco (iter_all_inspections): libera o cursor aberto
+        close = getattr(self._source, 'close', None)
+        if close is not None:
+            close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def paths(self) -> List[str]:
+        """Caminhos dos PDFs gerados, na ordem das inspeções de entrada"""
+        return [self.generated[i] for i in sorted(self.generated)]
+
 # Funções de conveniência para compatibilidade com o React
 def gerar_pdf_inspecao(inspection_data: Dict[str, Any], photo_path: Optional[str] = None) -> str:
     """